@@ -4,9 +4,11 @@ Local FileSystem Adapter
 Implementação do FileSystemPort para sistema de arquivos local.
 """
 
+import os
 import shutil
 from pathlib import Path
-from typing import Union
+from secrets import token_hex
+from typing import Iterable, Union
 
 from squidy.core.ports.filesystem import FileSystemPort
 
@@ -42,6 +44,30 @@ class LocalFileSystem(FileSystemPort):
         """Escreve texto em arquivo"""
         path.write_text(content, encoding=encoding)
     
+    def write_chunks(self, path: Path, chunks: Iterable[str], encoding: str = "utf-8") -> None:
+        """
+        Escreve texto em arquivo parte a parte
+        
+        As partes vão para um arquivo temporário ao lado do destino, que só
+        o substitui (os.replace, atômico) depois de todas consumidas: um erro
+        no meio da renderização preserva o arquivo existente. Links
+        simbólicos são resolvidos antes, então a escrita passa por eles.
+        """
+        path = path.resolve()
+        tmp_path = path.with_name(f".{path.name}.{token_hex(6)}.tmp")
+        
+        # 0o666 com O_EXCL: o kernel aplica a umask atual, como open("w")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with open(fd, "w", encoding=encoding) as f:
+                f.writelines(chunks)
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def read_bytes(self, path: Path) -> bytes:
         """Lê arquivo como bytes"""
         return path.read_bytes()
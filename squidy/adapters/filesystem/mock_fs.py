@@ -5,6 +5,10 @@ Implementação em memória do FileSystemPort para testes.
 Não faz operações reais no disco.
 """
 
+import os
+import posixpath
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 from datetime import datetime
@@ -12,6 +16,17 @@ from datetime import datetime
 from squidy.core.ports.filesystem import FileSystemPort
 
 
+@lru_cache(maxsize=1024)
+def _normalize(path: str) -> str:
+    """
+    Normaliza um caminho POSIX para string absoluta e internada
+    
+    Puramente textual (sem Path.resolve(), que consulta o disco real):
+    relativos são ancorados em "/", "." e ".." são resolvidos.
+    """
+    return sys.intern(posixpath.normpath(posixpath.join("/", path)))
+
+
 class MockFileSystem(FileSystemPort):
     """
     Mock de sistema de arquivos para testes
@@ -19,6 +34,10 @@ class MockFileSystem(FileSystemPort):
     Armazena tudo em memória, sem tocar no disco real.
     Útil para testes unitários rápidos e isolados.
     
+    Arquivos e diretórios ficam em tabelas planas indexadas pelo
+    caminho absoluto normalizado (string internada). Os métodos aceitam
+    Path, PurePath ou str: o caminho vira string uma única vez, na entrada.
+    
     Example:
         >>> fs = MockFileSystem()
         >>> fs.write_text(Path("/test/file.txt"), "Hello")
@@ -31,9 +50,9 @@ class MockFileSystem(FileSystemPort):
         self._dirs: set[str] = set()
         self._mtimes: dict[str, float] = {}
     
-    def _normalize_path(self, path: Path) -> str:
-        """Normaliza path para string absoluta"""
-        return str(path.resolve()) if path.is_absolute() else str(Path("/" / path).resolve())
+    def _normalize_path(self, path: Union[str, os.PathLike]) -> str:
+        """Normaliza path para string absoluta (chave dos dicionários internos)"""
+        return _normalize(os.fspath(path))
     
     def exists(self, path: Path) -> bool:
         """Verifica se caminho existe"""
@@ -63,11 +82,11 @@ class MockFileSystem(FileSystemPort):
             raise FileExistsError(f"Diretório {path} já existe")
         
         if parents and "/" in path_str:
-            # Cria diretórios pai
-            parts = path_str.split("/")
-            for i in range(2, len(parts) + 1):
-                parent = "/".join(parts[:i])
-                self._dirs.add(parent)
+            # Cria diretórios pai acumulando o prefixo (um único split)
+            prefix = ""
+            for part in path_str[1:].split("/"):
+                prefix = f"{prefix}/{part}"
+                self._dirs.add(prefix)
         else:
             self._dirs.add(path_str)
     
@@ -87,9 +106,7 @@ class MockFileSystem(FileSystemPort):
         self._files[path_str] = content
         self._mtimes[path_str] = datetime.now().timestamp()
         # Cria diretórios pai automaticamente
-        parent = path.parent
-        if str(parent) != ".":
-            self.mkdir(parent, parents=True, exist_ok=True)
+        self.mkdir(posixpath.dirname(path_str), parents=True, exist_ok=True)
     
     def read_bytes(self, path: Path) -> bytes:
         """Lê arquivo como bytes"""
@@ -106,9 +123,7 @@ class MockFileSystem(FileSystemPort):
         path_str = self._normalize_path(path)
         self._files[path_str] = content
         self._mtimes[path_str] = datetime.now().timestamp()
-        parent = path.parent
-        if str(parent) != ".":
-            self.mkdir(parent, parents=True, exist_ok=True)
+        self.mkdir(posixpath.dirname(path_str), parents=True, exist_ok=True)
     
     def unlink(self, path: Path, missing_ok: bool = False) -> None:
         """Remove arquivo"""
@@ -219,6 +234,27 @@ class MockFileSystem(FileSystemPort):
         self._dirs.clear()
         self._mtimes.clear()
     
+    def snapshot(self) -> tuple[dict, set, dict]:
+        """
+        Captura o estado atual (cópias rasas, baratas)
+        
+        Returns:
+            Estado a ser passado para restore()
+        """
+        return self._files.copy(), self._dirs.copy(), self._mtimes.copy()
+    
+    def restore(self, state: tuple[dict, set, dict]) -> None:
+        """
+        Restaura um estado capturado por snapshot()
+        
+        Args:
+            state: Estado retornado por snapshot()
+        """
+        files, dirs, mtimes = state
+        self._files = files.copy()
+        self._dirs = dirs.copy()
+        self._mtimes = mtimes.copy()
+    
     def dump_state(self) -> dict:
         """Retorna estado atual para debug"""
         return {
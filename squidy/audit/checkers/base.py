@@ -60,6 +60,7 @@ class BaseChecker(ABC):
         file: str | None = None,
         suggestion: str | None = None,
         auto_fixable: bool = False,
+        missing_path: str | None = None,
     ) -> Finding:
         """
         Helper para criar Finding
@@ -70,6 +71,7 @@ class BaseChecker(ABC):
             file: Arquivo afetado
             suggestion: Sugestão de correção
             auto_fixable: Se pode ser corrigido automaticamente
+            missing_path: Caminho obrigatório ausente
             
         Returns:
             Finding criado
@@ -81,6 +83,7 @@ class BaseChecker(ABC):
             file=file,
             suggestion=suggestion,
             auto_fixable=auto_fixable,
+            missing_path=missing_path,
         )
     
     def __str__(self) -> str:
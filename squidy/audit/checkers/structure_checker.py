@@ -32,8 +32,9 @@ class StructureChecker(BaseChecker):
     name = "StructureChecker"
     description = "Verifica se arquivos obrigatórios existem"
     
-    # Arquivos obrigatórios
-    REQUIRED_FILES = [
+    # Arquivos obrigatórios (tupla imutável, montada uma vez na importação;
+    # a ordem define a ordem dos findings)
+    REQUIRED_FILES = (
         "readme-agent.md",
         "doc/AGENT.md",
         "doc/constituicao.md",
@@ -43,13 +44,13 @@ class StructureChecker(BaseChecker):
         "doc/emergencia.md",
         "doc/indice-diario.md",
         "doc/contexto-sessao.md",
-    ]
+    )
     
     # Diretórios obrigatórios
-    REQUIRED_DIRS = [
+    REQUIRED_DIRS = (
         "doc",
         "diario",
-    ]
+    )
     
     def __init__(self, fs: FileSystemPort):
         super().__init__(fs)
@@ -76,6 +77,7 @@ class StructureChecker(BaseChecker):
                     severity=Severity.CRITICAL,
                     suggestion=f"Crie o diretório: mkdir {dir_name}",
                     auto_fixable=True,
+                    missing_path=dir_name,
                 ))
         
         # Verifica arquivos obrigatórios
@@ -88,6 +90,7 @@ class StructureChecker(BaseChecker):
                     file=file_path,
                     suggestion=f"Gere o arquivo com: squidy init --only-missing",
                     auto_fixable=True,
+                    missing_path=file_path,
                 ))
             else:
                 # Verifica se arquivo não está vazio
@@ -51,6 +51,22 @@ class BaseDetector(ABC):
         """
         pass
     
+    def detect_and_score(self, path: Path) -> tuple[bool, float]:
+        """
+        Detecta e retorna a confiança em uma única chamada
+        
+        Implementação padrão chama detect() e get_confidence();
+        detectores podem sobrescrever para inspecionar o diretório
+        uma única vez.
+        
+        Args:
+            path: Caminho do diretório
+            
+        Returns:
+            Tuple (detectado, confiança)
+        """
+        return self.detect(path), self.get_confidence(path)
+    
     def __str__(self) -> str:
         return f"{self.name}"
     
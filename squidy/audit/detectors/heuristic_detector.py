@@ -34,6 +34,9 @@ class HeuristicDetector(BaseDetector):
     # Pontuação por arquivo encontrado
     SCORE_PER_FILE = 0.25
     
+    # Score mínimo para detectar (pelo menos 2 arquivos)
+    DETECTION_THRESHOLD = 0.5
+    
     def __init__(self, fs: FileSystemPort):
         super().__init__(fs)
     
@@ -47,9 +50,7 @@ class HeuristicDetector(BaseDetector):
         Returns:
             True se encontrou arquivos suficientes
         """
-        score = self._calculate_score(path)
-        # Detecta se score >= 0.5 (pelo menos 2 arquivos)
-        return score >= 0.5
+        return self.detect_and_score(path)[0]
     
     def get_confidence(self, path: Path) -> float:
         """
@@ -60,6 +61,19 @@ class HeuristicDetector(BaseDetector):
         """
         return self._calculate_score(path)
     
+    def detect_and_score(self, path: Path) -> tuple[bool, float]:
+        """
+        Detecta e retorna a confiança calculando o score uma única vez
+        
+        Args:
+            path: Caminho do diretório
+            
+        Returns:
+            Tuple (detectado, confiança)
+        """
+        score = self._calculate_score(path)
+        return score >= self.DETECTION_THRESHOLD, score
+    
     def _calculate_score(self, path: Path) -> float:
         """
         Calcula score baseado em arquivos encontrados
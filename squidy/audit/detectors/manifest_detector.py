@@ -4,9 +4,9 @@ Manifest Detector
 Detecta projeto Squidy via arquivo .squidy/manifest.json
 """
 
-import json
 from pathlib import Path
 
+from squidy.core.jsonio import JSONDecodeError, loads
 from squidy.core.ports.filesystem import FileSystemPort
 
 from .base import BaseDetector
@@ -42,14 +42,13 @@ class ManifestDetector(BaseDetector):
             return False
         
         try:
-            content = self.fs.read_text(manifest_path)
-            manifest = json.loads(content)
+            manifest = loads(self.fs.read_bytes(manifest_path))
             
             # Verifica campos obrigatórios
             required_fields = ["name", "version", "created_at"]
             return all(field in manifest for field in required_fields)
             
-        except (json.JSONDecodeError, Exception):
+        except (JSONDecodeError, Exception):
             return False
     
     def get_confidence(self, path: Path) -> float:
@@ -59,7 +58,17 @@ class ManifestDetector(BaseDetector):
         Returns:
             1.0 se manifest válido, 0.0 caso contrário
         """
-        return 1.0 if self.detect(path) else 0.0
+        return self.detect_and_score(path)[1]
+    
+    def detect_and_score(self, path: Path) -> tuple[bool, float]:
+        """
+        Detecta e retorna a confiança lendo o manifest uma única vez
+        
+        Returns:
+            Tuple (detectado, 1.0 ou 0.0)
+        """
+        detected = self.detect(path)
+        return detected, 1.0 if detected else 0.0
     
     def read_manifest(self, path: Path) -> dict | None:
         """
@@ -77,7 +86,6 @@ class ManifestDetector(BaseDetector):
             return None
         
         try:
-            content = self.fs.read_text(manifest_path)
-            return json.loads(content)
+            return loads(self.fs.read_bytes(manifest_path))
         except Exception:
             return None
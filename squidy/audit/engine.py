@@ -76,8 +76,8 @@ class AuditEngine:
         
         for detector_class in self._detectors:
             detector = detector_class(self.fs)
-            if detector.detect(path):
-                confidence = detector.get_confidence(path)
+            detected, confidence = detector.detect_and_score(path)
+            if detected:
                 max_confidence = max(max_confidence, confidence)
         
         return (max_confidence > 0.5, max_confidence)
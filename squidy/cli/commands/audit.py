@@ -79,8 +79,9 @@ class AuditCommand:
             return True, 1.0
         
         detector = HeuristicDetector(self.fs)
-        if detector.detect(path):
-            return True, detector.get_confidence(path)
+        detected, confidence = detector.detect_and_score(path)
+        if detected:
+            return True, confidence
         
         return False, 0.0
     
@@ -3,7 +3,6 @@ Init Command - Comando de inicialização de projeto
 """
 
 import getpass
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +17,7 @@ from squidy.adapters.providers.openai_adapter import OpenAIAdapter
 from squidy.adapters.providers.anthropic_adapter import AnthropicAdapter
 from squidy.core.domain.config import ProjectConfig
 from squidy.core.i18n import i18n
+from squidy.core.jsonio import loads
 from squidy.core.ports.ai_provider import AIProviderPort
 from squidy.core.ports.filesystem import FileSystemPort
 from squidy.generation.file_generator import FileGenerator
@@ -99,8 +99,7 @@ class InitCommand:
             return None
         
         try:
-            content = self.fs.read_text(manifest_path)
-            manifest = json.loads(content)
+            manifest = loads(self.fs.read_bytes(manifest_path))
             language = manifest.get("language")
             
             # Valida idioma
@@ -30,6 +30,7 @@ class Finding(BaseModel):
         line: Linha afetada (opcional)
         suggestion: Sugestão de correção
         auto_fixable: Se pode ser corrigido automaticamente
+        missing_path: Caminho obrigatório ausente, relativo ao projeto (opcional)
     """
     
     checker: str = Field(..., description="Nome do checker")
@@ -39,6 +40,7 @@ class Finding(BaseModel):
     line: Optional[int] = Field(default=None, description="Linha afetada")
     suggestion: Optional[str] = Field(default=None, description="Sugestão de correção")
     auto_fixable: bool = Field(default=False, description="Pode ser corrigido automaticamente")
+    missing_path: Optional[str] = Field(default=None, description="Caminho obrigatório ausente")
     
     def __str__(self) -> str:
         emoji = {
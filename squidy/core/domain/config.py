@@ -2,9 +2,33 @@
 Configuração do projeto Squidy
 """
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from pydantic import BaseModel, Field, field_validator
 
+# Valores padrão de governança: tuplas imutáveis, compartilhadas por
+# todas as instâncias em vez de uma lista nova por configuração
+DEFAULT_PRINCIPIOS: tuple[str, ...] = (
+    "Manter código limpo e legível",
+    "Escrever testes automatizados",
+    "Documentar decisões importantes",
+    "Fazer code review antes de merge",
+)
+
+DEFAULT_PROIBICOES: tuple[str, ...] = (
+    "Nunca commitar código sem testes",
+    "Nunca subir credenciais ou secrets",
+    "Nunca fazer deploy sem CI passar",
+    "Nunca pular code review",
+)
+
+DEFAULT_DOD: tuple[str, ...] = (
+    "Testes unitários passando",
+    "Code review aprovado",
+    "Documentação atualizada",
+    "CI/CD pipeline verde",
+    "Sem warnings do linter",
+)
+
 
 class StackConfig(BaseModel):
     """Configuração da stack tecnológica"""
@@ -74,19 +98,16 @@ class ProjectConfig(BaseModel):
     )
     
     # Governança
-    principios: list[str] = Field(
-        default_factory=list,
-        validate_default=True,
+    principios: Sequence[str] = Field(
+        default=DEFAULT_PRINCIPIOS,
         description="Princípios do projeto (o que SEMPRE fazer)"
     )
-    proibicoes: list[str] = Field(
-        default_factory=list,
-        validate_default=True,
+    proibicoes: Sequence[str] = Field(
+        default=DEFAULT_PROIBICOES,
         description="Proibições do projeto (o que NUNCA fazer)"
     )
-    dod: list[str] = Field(
-        default_factory=list,
-        validate_default=True,
+    dod: Sequence[str] = Field(
+        default=DEFAULT_DOD,
         description="Definition of Done (critérios de pronto)"
     )
     restricoes: list[str] = Field(
@@ -104,42 +125,26 @@ class ProjectConfig(BaseModel):
     
     @field_validator("principios")
     @classmethod
-    def validate_principios(cls, v: list[str]) -> list[str]:
+    def validate_principios(cls, v: Sequence[str]) -> Sequence[str]:
         """Garante que há princípios definidos"""
         if not v:
-            return [
-                "Manter código limpo e legível",
-                "Escrever testes automatizados",
-                "Documentar decisões importantes",
-                "Fazer code review antes de merge",
-            ]
+            return DEFAULT_PRINCIPIOS
         return v
     
     @field_validator("proibicoes")
     @classmethod
-    def validate_proibicoes(cls, v: list[str]) -> list[str]:
+    def validate_proibicoes(cls, v: Sequence[str]) -> Sequence[str]:
         """Garante que há proibições definidas"""
         if not v:
-            return [
-                "Nunca commitar código sem testes",
-                "Nunca subir credenciais ou secrets",
-                "Nunca fazer deploy sem CI passar",
-                "Nunca pular code review",
-            ]
+            return DEFAULT_PROIBICOES
         return v
     
     @field_validator("dod")
     @classmethod
-    def validate_dod(cls, v: list[str]) -> list[str]:
+    def validate_dod(cls, v: Sequence[str]) -> Sequence[str]:
         """Garante que há DoD definido"""
         if not v:
-            return [
-                "Testes unitários passando",
-                "Code review aprovado",
-                "Documentação atualizada",
-                "CI/CD pipeline verde",
-                "Sem warnings do linter",
-            ]
+            return DEFAULT_DOD
         return v
     
     def to_dict(self) -> dict[str, Any]:
@@ -14,11 +14,72 @@ Example:
 """
 
 import os
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 
+# Parser YAML em C (libyaml) quando disponível; senão o puro-Python
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _flatten(translations: dict, prefix: str = "") -> dict[str, str]:
+    """
+    Achata o dicionário aninhado em chaves pontuadas.
+    
+    As chaves são internadas: literais passados a t() (já internados pelo
+    CPython) casam por identidade na busca do dict.
+    
+    Example:
+        >>> _flatten({"banner": {"title": "Squidy"}})
+        {"banner.title": "Squidy"}
+    """
+    flat: dict[str, str] = {}
+    
+    for k, value in translations.items():
+        if not isinstance(k, str):
+            continue
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{k}."))
+        else:
+            flat[sys.intern(f"{prefix}{k}")] = str(value)
+    
+    return flat
+
+
+@lru_cache(maxsize=8)
+def _read_locale_dir(lang_dir: Path) -> dict:
+    """
+    Lê e mescla os arquivos YAML de um diretório de idioma.
+    
+    Memoizado por processo: novas instâncias de I18nManager (ex: testes
+    que zeram o singleton) reaproveitam o parse já feito.
+    
+    Args:
+        lang_dir: Diretório do idioma (ex: squidy/locales/pt-BR)
+        
+    Returns:
+        Dicionário de traduções (compartilhado, não modificar)
+    """
+    translations: dict = {}
+    
+    # Carrega todos os arquivos YAML do idioma
+    if lang_dir.exists():
+        for yaml_file in sorted(lang_dir.glob("*.yaml")):
+            try:
+                data = yaml.load(yaml_file.read_bytes(), Loader=_YamlLoader)
+                if isinstance(data, dict):
+                    # Merge direto no dicionário raiz (sem namespace por arquivo)
+                    translations.update(data)
+            except Exception:
+                # Ignora arquivos com erro
+                pass
+    
+    return translations
+
 
 class I18nManager:
     """
@@ -31,9 +92,12 @@ class I18nManager:
         current_lang: Idioma atual (ex: "pt-BR", "en-US")
         default_lang: Idioma padrão de fallback
         translations: Cache de traduções carregadas
+        _flat: Traduções achatadas por idioma (chave pontuada -> string)
         _instance: Singleton instance
     """
     
+    __slots__ = ("current_lang", "default_lang", "translations", "_flat", "_locales_dir")
+    
     _instance: "I18nManager | None" = None
     
     # Idiomas suportados
@@ -46,23 +110,24 @@ class I18nManager:
     DEFAULT_LANGUAGE = "pt-BR"
     
     def __new__(cls) -> "I18nManager":
-        """Singleton pattern para garantir instância única"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        """Inicializa o gerenciador de i18n (apenas uma vez)"""
-        if self._initialized:
-            return
+        """
+        Retorna a instância única (criada e inicializada na primeira chamada).
         
+        Sem __init__: chamadas seguintes não reexecutam a inicialização.
+        """
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+            instance.reset()
+        return instance
+    
+    def reset(self) -> None:
+        """Restaura o estado inicial (idioma padrão e caches vazios)"""
         self.current_lang: str = self.DEFAULT_LANGUAGE
         self.default_lang: str = self.DEFAULT_LANGUAGE
         self.translations: dict[str, dict] = {}
+        self._flat: dict[str, dict[str, str]] = {}
         self._locales_dir: Path | None = None
-        
-        self._initialized = True
     
     def set_language(self, lang_code: str) -> bool:
         """
@@ -80,6 +145,10 @@ class I18nManager:
             >>> i18n.set_language("fr-FR")
             False
         """
+        # Mesmo idioma com traduções já carregadas: nada a fazer
+        if lang_code == self.current_lang and lang_code in self.translations:
+            return True
+        
         if lang_code not in self.SUPPORTED_LANGUAGES:
             return False
         
@@ -88,6 +157,30 @@ class I18nManager:
         self._load_translations(lang_code)
         return True
     
+    @contextmanager
+    def override_language(self, lang_code: str) -> Iterator[bool]:
+        """
+        Troca o idioma temporariamente, restaurando o anterior na saída.
+        
+        Apenas o idioma atual é trocado; o cache de traduções é mantido.
+        
+        Args:
+            lang_code: Código do idioma (ex: "en-US", "pt-BR")
+            
+        Yields:
+            True se idioma foi definido, False se não suportado
+            
+        Example:
+            >>> with i18n.override_language("en-US"):
+            ...     i18n.t("welcome.message")
+            "Welcome to Squidy!"
+        """
+        previous = self.current_lang
+        try:
+            yield self.set_language(lang_code)
+        finally:
+            self.current_lang = previous
+    
     def get_language(self) -> str:
         """Retorna o idioma atual"""
         return self.current_lang
@@ -152,25 +245,20 @@ class I18nManager:
         Returns:
             String traduzida ou None se não encontrada
         """
-        translations = self._load_translations(lang_code)
+        flat = self._flat.get(lang_code)
         
-        # Navega no dicionário aninhado
-        keys = key.split(".")
-        value = translations
+        # Achata uma vez por idioma: a busca vira um único acesso ao dict
+        if flat is None:
+            flat = self._flat[lang_code] = _flatten(self._load_translations(lang_code))
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return None
-        
-        return str(value) if not isinstance(value, dict) else None
+        return flat.get(key)
     
     def _load_translations(self, lang_code: str) -> dict:
         """
         Carrega traduções de um idioma.
         
-        Usa cache para evitar leituras repetidas.
+        Usa cache (por instância e por processo) para evitar leituras
+        e parses repetidos.
         
         Args:
             lang_code: Código do idioma
@@ -181,23 +269,7 @@ class I18nManager:
         if lang_code in self.translations:
             return self.translations[lang_code]
         
-        translations = {}
-        locales_dir = self._get_locales_dir()
-        lang_dir = locales_dir / lang_code
-        
-        # Carrega todos os arquivos YAML do idioma
-        if lang_dir.exists():
-            for yaml_file in sorted(lang_dir.glob("*.yaml")):
-                try:
-                    with open(yaml_file, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                        if isinstance(data, dict):
-                            # Merge direto no dicionário raiz (sem namespace por arquivo)
-                            translations.update(data)
-                except Exception:
-                    # Ignora arquivos com erro
-                    pass
-        
+        translations = _read_locale_dir(self._get_locales_dir() / lang_code)
         self.translations[lang_code] = translations
         return translations
     
@@ -213,14 +285,17 @@ class I18nManager:
         """Define diretório customizado de locales (útil para testes)"""
         self._locales_dir = path
         self.translations.clear()  # Limpa cache
+        self._flat.clear()
     
     def get_supported_languages(self) -> dict[str, str]:
         """Retorna dicionário de idiomas suportados"""
         return self.SUPPORTED_LANGUAGES.copy()
     
     def clear_cache(self) -> None:
-        """Limpa cache de traduções"""
+        """Limpa cache de traduções (inclusive o parse dos arquivos)"""
         self.translations.clear()
+        self._flat.clear()
+        _read_locale_dir.cache_clear()
 
 
 # Instância global (singleton)
@@ -0,0 +1,19 @@
+"""
+Leitura de JSON
+
+Usa orjson (extra opcional `squidy[fast]`) quando instalado; senão o
+json da biblioteca padrão. Ambos aceitam bytes diretamente, então o
+conteúdo lido com read_bytes() não precisa ser decodificado antes.
+
+Example:
+    >>> from squidy.core.jsonio import loads
+    >>> loads(b'{"language": "en-US"}')
+    {'language': 'en-US'}
+"""
+
+try:
+    from orjson import JSONDecodeError, loads
+except ImportError:
+    from json import JSONDecodeError, loads
+
+__all__ = ["JSONDecodeError", "loads"]
@@ -7,7 +7,7 @@ facilitando testes com mocks e suporte a diferentes backends.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 
 class FileSystemPort(ABC):
@@ -49,6 +49,16 @@ class FileSystemPort(ABC):
         """Escreve texto em arquivo"""
         pass
     
+    def write_chunks(self, path: Path, chunks: Iterable[str], encoding: str = "utf-8") -> None:
+        """
+        Escreve texto em arquivo a partir de partes
+        
+        Implementação padrão junta as partes e usa write_text;
+        adaptadores podem sobrescrever para escrever sem montar
+        o conteúdo completo em memória.
+        """
+        self.write_text(path, "".join(chunks), encoding=encoding)
+    
     @abstractmethod
     def read_bytes(self, path: Path) -> bytes:
         """Lê arquivo como bytes"""
@@ -8,7 +8,7 @@ import json
 from datetime import datetime
 from importlib.metadata import version as pkg_version
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -16,7 +16,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from squidy.core.domain.config import ProjectConfig
 from squidy.core.i18n import i18n
 from squidy.core.ports.filesystem import FileSystemPort
-from squidy.generation.template_engine import TemplateEngine
+from squidy.generation.template_engine import TemplateEngine, time_context
 
 console = Console()
 
@@ -82,14 +82,9 @@ class FileGenerator:
         Returns:
             Lista de arquivos gerados
         """
-        generated = []
-        
         # Cria diretórios
         self._create_directories(output_dir)
         
-        # Prepara contexto para templates
-        context = self._prepare_context(config)
-        
         if progress:
             with Progress(
                 SpinnerColumn(),
@@ -100,47 +95,11 @@ class FileGenerator:
                     f"[bright_cyan]{i18n.t('progress.generating_files')}",
                     total=len(self.FILES) + 2,  # +1 para diário, +1 para manifest
                 )
-                
-                for template_name, output_name, is_root in self.FILES:
-                    self._generate_file(
-                        output_dir,
-                        template_name,
-                        output_name,
-                        is_root,
-                        context,
-                    )
-                    generated.append(output_name if is_root else f"doc/{output_name}")
-                    progress_bar.advance(task)
-                
-                # Gera arquivo de diário
-                self._generate_diary(output_dir, context)
-                generated.append(f"diario/{context['month']}.md")
-                progress_bar.advance(task)
-                
-                # Gera manifest
-                self._generate_manifest(output_dir, config)
-                generated.append(".squidy/manifest.json")
-                progress_bar.advance(task)
-        else:
-            for template_name, output_name, is_root in self.FILES:
-                self._generate_file(
-                    output_dir,
-                    template_name,
-                    output_name,
-                    is_root,
-                    context,
+                return self._generate_batch(
+                    config, output_dir, lambda: progress_bar.advance(task)
                 )
-                generated.append(output_name if is_root else f"doc/{output_name}")
-            
-            # Gera arquivo de diário
-            self._generate_diary(output_dir, context)
-            generated.append(f"diario/{context['month']}.md")
-            
-            # Gera manifest
-            self._generate_manifest(output_dir, config)
-            generated.append(".squidy/manifest.json")
         
-        return generated
+        return self._generate_batch(config, output_dir)
     
     def generate_single(
         self,
@@ -175,6 +134,55 @@ class FileGenerator:
         
         raise ValueError(f"Template não encontrado: {template_name}")
     
+    def _generate_batch(
+        self,
+        config: ProjectConfig,
+        output_dir: Path,
+        advance: Callable[[], None] | None = None,
+    ) -> list[str]:
+        """
+        Gera arquivos, diário e manifest em uma única passada
+        
+        O contexto é montado uma vez e compartilhado por todos os templates.
+        
+        Args:
+            config: Configuração do projeto
+            output_dir: Diretório de saída
+            advance: Chamado após cada arquivo gerado (barra de progresso)
+            
+        Returns:
+            Lista de arquivos gerados
+        """
+        # Um único instante para todos os arquivos (contexto e manifest)
+        now = datetime.now()
+        context = self._prepare_context(config, now)
+        
+        # Template -> caminho relativo de saída
+        outputs = {
+            template_name: output_name if is_root else f"doc/{output_name}"
+            for template_name, output_name, is_root in self.FILES
+        }
+        outputs["diario.md"] = f"diario/{context['month']}.md"
+        
+        generated = []
+        language = i18n.get_language()
+        
+        for template_name, chunks in self.template_engine.stream_all(
+            outputs, language=language, **context
+        ):
+            self.fs.write_chunks(output_dir / outputs[template_name], chunks)
+            generated.append(outputs[template_name])
+            if advance:
+                advance()
+        
+        # Gera manifest
+        self._generate_manifest(output_dir, config, now)
+        generated.append(".squidy/manifest.json")
+        if advance:
+            advance()
+        
+        return generated
+    
     def _create_directories(self, output_dir: Path) -> None:
         """Cria estrutura de diretórios"""
         self.fs.mkdir(output_dir, parents=True, exist_ok=True)
@@ -182,16 +190,15 @@ class FileGenerator:
         self.fs.mkdir(output_dir / "doc", parents=True, exist_ok=True)
         self.fs.mkdir(output_dir / "diario", parents=True, exist_ok=True)
     
-    def _prepare_context(self, config: ProjectConfig) -> dict[str, Any]:
+    def _prepare_context(
+        self,
+        config: ProjectConfig,
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
         """Prepara contexto para templates"""
-        now = datetime.now()
-        
         context = {
             **config.to_dict(),
-            "now": now,
-            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "date": now.strftime("%Y-%m-%d"),
-            "month": now.strftime("%Y-%m"),
+            **time_context(now or datetime.now()),
         }
         
         return context
@@ -205,30 +212,22 @@ class FileGenerator:
         context: dict[str, Any],
     ) -> None:
         """Gera um arquivo individual"""
-        # Renderiza template com idioma atual
-        language = i18n.get_language()
-        content = self.template_engine.render(template_name, language=language, **context)
-        
         # Determina caminho de saída
         if is_root:
             output_path = output_dir / output_name
         else:
             output_path = output_dir / "doc" / output_name
         
-        # Escreve arquivo
-        self.fs.write_text(output_path, content)
-    
-    def _generate_diary(self, output_dir: Path, context: dict[str, Any]) -> None:
-        """Gera arquivo de diário mensal"""
+        # Renderiza template com idioma atual, escrevendo em partes
         language = i18n.get_language()
-        content = self.template_engine.render("diario.md", language=language, **context)
-        output_path = output_dir / "diario" / f"{context['month']}.md"
-        self.fs.write_text(output_path, content)
+        chunks = self.template_engine.stream(template_name, language=language, **context)
+        self.fs.write_chunks(output_path, chunks)
     
     def _generate_manifest(
         self,
         output_dir: Path,
         config: ProjectConfig,
+        now: datetime | None = None,
     ) -> None:
         """
         Gera arquivo manifest.json
@@ -236,14 +235,16 @@ class FileGenerator:
         Args:
             output_dir: Diretório de saída
             config: Configuração do projeto
+            now: Instante da geração (padrão: agora)
         """
+        timestamp = (now or datetime.now()).isoformat()
         manifest = {
             "name": config.project_name,
             "display_name": config.display_name,
             "version": config.version,
             "language": i18n.get_language(),
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": timestamp,
+            "updated_at": timestamp,
             "squidy_version": _get_squidy_version(),
             "agent_type": config.agent_type,
             "stack": {
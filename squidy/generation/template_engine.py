@@ -4,36 +4,389 @@ Template Engine
 Motor de templates usando Jinja2 para gerar arquivos de documentação.
 """
 
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from hashlib import sha1
+from importlib.resources import files
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Iterator, Mapping, NamedTuple
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+    meta,
+    nodes,
+)
+from jinja2.loaders import split_template_path
+
+from squidy.core.jsonio import JSONDecodeError, loads
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+# Diretório dos templates empacotados (um subdiretório por idioma)
+_TEMPLATE_DIR = files("squidy.generation") / "templates"
+
+# Extensão dos arquivos de template
+TEMPLATE_SUFFIX = ".j2"
+
+# Idade máxima das entradas do cache de bytecode (30 dias)
+_BYTECODE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Versão do formato dos metadados gravados no cache (mude ao alterá-lo)
+_METADATA_VERSION = 1
+
+# Máximo de saídas renderizadas mantidas em memória (LRU)
+_RENDER_CACHE_SIZE = 128
+
+# Templates disponíveis em todos os idiomas. Fragmentos compartilhados
+# (prefixo "_", ex: "_stack.md") são usados apenas via {% include %};
+# os idênticos entre idiomas ficam em "shared/" (ex: "shared/_dod.md").
+# Os nomes são internados para que catálogos, loaders e o mapa de
+# compilados compartilhem os mesmos objetos string como chave.
+TEMPLATE_NAMES = tuple(
+    sys.intern(name)
+    for name in (
+        "readme-agent.md",
+        "constituicao.md",
+        "kanban.md",
+        "oraculo.md",
+        "politicas.md",
+        "emergencia.md",
+        "indice-diario.md",
+        "contexto-sessao.md",
+        "AGENT.md",
+        "diario.md",
+    )
+)
+
+
+def time_context(now: datetime) -> dict[str, str]:
+    """
+    Formata as variantes de data/hora usadas pelos templates
+    
+    Os templates recebem apenas strings já formatadas; o objeto
+    datetime não é exposto ao Jinja.
+    
+    Args:
+        now: Instante de referência da renderização
+        
+    Returns:
+        Dicionário com timestamp, date, month, year e hhmm
+    """
+    # Um único strftime; as demais variantes são fatias do timestamp
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "timestamp": timestamp,
+        "date": timestamp[:10],
+        "month": timestamp[:7],
+        "year": timestamp[:4],
+        "hhmm": timestamp[11:16],
+    }
+
+
+@lru_cache(maxsize=4)
+def _default_context(second: int, language: str) -> Mapping[str, str]:
+    """
+    Contexto padrão de renderização para um segundo (epoch) e idioma
+    
+    Memorizado: renderizações em sequência no mesmo segundo reaproveitam
+    as mesmas strings formatadas. O retorno é somente leitura.
+    """
+    return MappingProxyType(
+        {**time_context(datetime.fromtimestamp(second)), "language": language}
+    )
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    """
+    Cria o cache de bytecode do Jinja em disco
+    
+    Usa $SQUIDY_JINJA_CACHE ou ~/.cache/squidy/jinja. Como o Jinja nunca
+    remove entradas antigas, arquivos gravados há mais de 30 dias (bytecode
+    e metadados) são apagados aqui (e recompilados no próximo uso).
+    
+    Returns:
+        Cache de bytecode, ou None se o diretório não puder ser criado
+    """
+    try:
+        cache_dir = Path(
+            os.environ.get("SQUIDY_JINJA_CACHE") or Path.home() / ".cache" / "squidy" / "jinja"
+        )
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError):
+        return None
+    
+    cutoff = time.time() - _BYTECODE_CACHE_MAX_AGE
+    entries = chain(cache_dir.glob("__jinja2_*.cache"), cache_dir.glob("__squidy_meta_*.json"))
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+    
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+# Tabelas de tradução dos filtros (uma única passada por string)
+_KEBAB_TABLE = str.maketrans({" ": "-", "_": "-"})
+_SNAKE_TABLE = str.maketrans({" ": "_", "-": "_"})
+_PASCAL_TABLE = str.maketrans({"-": " ", "_": " "})
+
+
+def kebab_case(value: str) -> str:
+    """Converte para kebab-case"""
+    return value.translate(_KEBAB_TABLE).lower()
+
+
+def pascal_case(value: str) -> str:
+    """Converte para PascalCase"""
+    return "".join(word.capitalize() for word in value.translate(_PASCAL_TABLE).split())
+
+
+def snake_case(value: str) -> str:
+    """Converte para snake_case"""
+    return value.translate(_SNAKE_TABLE).lower()
+
+
+# Filtros customizados registrados no Environment
+_FILTERS = {
+    "kebab_case": kebab_case,
+    "pascal_case": pascal_case,
+    "snake_case": snake_case,
+}
+
+
+# Exemplos da tabela de convenções da constituição, por idioma:
+# chave -> (convenção esperada, exemplo se usada, exemplo caso contrário)
+_CONVENTION_SAMPLES: dict[str, dict[str, tuple[str, str, str]]] = {
+    "pt-BR": {
+        "variaveis": ("camelCase", "usuarioAtual", "usuario_atual"),
+        "funcoes": ("camelCase", "calcularTotal", "calcular_total"),
+        "classes": ("PascalCase", "UsuarioService", "usuario_service"),
+        "constantes": ("UPPER_SNAKE", "MAX_TENTATIVAS", "max_tentativas"),
+        "arquivos": ("kebab-case", "usuario-service", "usuario_service"),
+        "banco": ("snake_case", "usuario_id", "usuarioId"),
+    },
+    "en-US": {
+        "variaveis": ("camelCase", "currentUser", "current_user"),
+        "funcoes": ("camelCase", "calculateTotal", "calculate_total"),
+        "classes": ("PascalCase", "UserService", "user_service"),
+        "constantes": ("UPPER_SNAKE", "MAX_RETRIES", "max_retries"),
+        "arquivos": ("kebab-case", "user-service", "user_service"),
+        "banco": ("snake_case", "user_id", "userId"),
+    },
+}
+
+
+def convention_examples(convencoes: Any, language: str) -> dict[str, str]:
+    """
+    Escolhe o exemplo de cada convenção de nomenclatura
+    
+    Args:
+        convencoes: Convenções do projeto (dict ou objeto com atributos)
+        language: Idioma dos exemplos
+        
+    Returns:
+        Dicionário chave -> exemplo (ex: {"classes": "UserService"})
+    """
+    if isinstance(convencoes, Mapping):
+        get = convencoes.get
+    else:
+        def get(key: str) -> Any:
+            return getattr(convencoes, key, None)
+    
+    return {
+        key: match if get(key) == expected else other
+        for key, (expected, match, other) in _CONVENTION_SAMPLES[language].items()
+    }
+
+
+# Listas renderizadas em Python como blocos de linhas (um item por linha):
+# variável do bloco -> (lista de origem no contexto, formato da linha)
+_LIST_BLOCKS: dict[str, tuple[str, str]] = {
+    "principios_block": ("principios", "- {}\n"),
+    "proibicoes_block": ("proibicoes", "- {}\n"),
+    "dod_block": ("dod", "- [ ] {}\n"),
+}
+
+
+def _prerender_lists(context: dict[str, Any], variables: frozenset[str] | None) -> None:
+    """
+    Adiciona ao contexto os blocos de lista usados pelo template
+    
+    Args:
+        context: Contexto de renderização (modificado no lugar)
+        variables: Variáveis referenciadas pelo template (None = todas)
+    """
+    for block, (source, line) in _LIST_BLOCKS.items():
+        if (variables is None or block in variables) and block not in context:
+            context[block] = "".join(map(line.format, context.get(source) or ()))
+
+
+def _select(context: dict[str, Any], variables: frozenset[str] | None) -> dict[str, Any]:
+    """Repassa ao Jinja apenas as variáveis que o template referencia (None = todas)"""
+    if variables is None:
+        return context
+    return {name: context[name] for name in variables if name in context}
+
+
+def _format_string(ast: nodes.Template) -> str | None:
+    """
+    Converte um template trivial em string para str.format_map
+    
+    Um template é trivial se contém apenas texto e `{{ variavel }}`
+    (sem blocos, filtros, atributos ou expressões).
+    
+    Args:
+        ast: Template já parseado pelo Jinja
+        
+    Returns:
+        String de formatação equivalente, ou None se o template não for trivial
+    """
+    parts = []
+    for node in ast.body:
+        if not isinstance(node, nodes.Output):
+            return None
+        for child in node.nodes:
+            if isinstance(child, nodes.TemplateData):
+                parts.append(child.data.replace("{", "{{").replace("}", "}}"))
+            elif isinstance(child, nodes.Name):
+                parts.append(f"{{{child.name}}}")
+            else:
+                return None
+    return "".join(parts)
+
+
+class _TemplateMetadata(NamedTuple):
+    """Dados extraídos do AST de uma fonte (sem considerar os includes)"""
+    
+    variables: frozenset[str]
+    includes: tuple[str, ...] | None  # None = include dinâmico
+    format_string: str | None
+
+
+def _template_metadata(env: Environment, source: str) -> _TemplateMetadata:
+    """
+    Variáveis, includes e string de formatação de uma fonte de template
+    
+    Com cache de bytecode em disco, o resultado é gravado ao lado do
+    bytecode, em um arquivo endereçado pelo hash da fonte: execuções
+    seguintes não parseiam fontes inalteradas, e uma fonte editada
+    nunca reaproveita dados antigos.
+    
+    Args:
+        env: Environment dos templates
+        source: Fonte do template
+    
+    Returns:
+        Metadados da fonte
+    """
+    path = None
+    if isinstance(env.bytecode_cache, FileSystemBytecodeCache):
+        digest = sha1(source.encode("utf-8")).hexdigest()
+        path = Path(env.bytecode_cache.directory) / (
+            f"__squidy_meta_{_METADATA_VERSION}_{digest}.json"
+        )
+        try:
+            data = loads(path.read_bytes())
+            includes = data["includes"]
+            return _TemplateMetadata(
+                frozenset(data["variables"]),
+                None if includes is None else tuple(includes),
+                data["format_string"],
+            )
+        except (OSError, JSONDecodeError, KeyError, TypeError):
+            pass
+    
+    ast = env.parse(source)
+    includes = tuple(meta.find_referenced_templates(ast))
+    metadata = _TemplateMetadata(
+        frozenset(meta.find_undeclared_variables(ast)),
+        includes if all(includes) else None,
+        _format_string(ast),
+    )
+    
+    if path is not None:
+        try:
+            path.write_text(json.dumps(metadata._asdict(), default=sorted), encoding="utf-8")
+        except OSError:
+            pass
+    
+    return metadata
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Converte um valor do contexto em uma chave de cache imutável
+    
+    Aceita apenas str, números, bool, None, dicts e listas/tuplas deles;
+    qualquer outro tipo (ex: objetos mutáveis) levanta TypeError.
+    """
+    if type(value) is str:
+        return value
+    if value is None or type(value) in (int, float, bool):
+        # O tipo entra na chave: 1, 1.0 e True renderizam diferente
+        return type(value), value
+    if isinstance(value, Mapping):
+        return dict, frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple, tuple(_freeze(item) for item in value)
+    raise TypeError(f"valor não congelável: {type(value).__name__}")
 
-from jinja2 import BaseLoader, Environment, TemplateNotFound
+
+class _FormatContext(dict):
+    """Contexto para str.format_map: variáveis ausentes viram "" (como no Jinja)"""
+    
+    def __missing__(self, key: str) -> str:
+        return ""
 
 
 class TemplateLoader(BaseLoader):
     """
-    Loader de templates em memória
+    Loader de templates empacotados
     
-    Carrega templates de strings (não de arquivos).
+    Lê os arquivos `<idioma>/<nome>.j2` do diretório de templates via
+    importlib.resources. Cada template é lido sob demanda e
+    memorizado, de modo que templates nunca renderizados não
+    são carregados.
     """
     
-    def __init__(self, templates: dict[str, str]):
-        self.templates = templates
+    def __init__(self, directory: "Traversable"):
+        self.directory = directory
+        self._cache: dict[str, str] = {}
     
     def get_source(self, environment, template):
-        if template in self.templates:
-            source = self.templates[template]
-            return source, None, lambda: True
-        raise TemplateNotFound(template)
+        path = self.directory
+        for piece in split_template_path(f"{template}{TEMPLATE_SUFFIX}"):
+            path = path / piece
+        source = self._cache.get(template)
+        if source is None:
+            # Lido do pacote só no primeiro uso de cada template
+            if not path.is_file():
+                raise TemplateNotFound(template)
+            source = self._cache[template] = path.read_text(encoding="utf-8")
+        return source, str(path), None
 
 
 class TemplateEngine:
     """
     Motor de templates para geração de arquivos
     
-    Usa Jinja2 com templates embutidos.
-    Suporta múltiplos idiomas (pt-BR, en-US).
+    Usa Jinja2 com templates empacotados em squidy/generation/templates/.
+    Suporta múltiplos idiomas (pt-BR, en-US) com um único Environment,
+    no qual cada template é identificado por "<idioma>/<nome>".
     
     Example:
         >>> engine = TemplateEngine()
@@ -43,29 +396,36 @@ class TemplateEngine:
     # Idioma padrão
     DEFAULT_LANGUAGE = "pt-BR"
     
+    # Idiomas com templates disponíveis
+    SUPPORTED_LANGUAGES = ("pt-BR", "en-US")
+    
+    # Estado compartilhado entre instâncias. Environment e catálogos são montados
+    # na primeira construção; os templates de cada idioma são compilados no
+    # primeiro uso desse idioma.
+    _env: ClassVar[Environment | None] = None
+    _template_keys: ClassVar[dict[str, Mapping[str, str]]] = {}
+    _template_names: ClassVar[dict[str, tuple[str, ...]]] = {}
+    _compiled: ClassVar[dict[tuple[str, str], Template]] = {}
+    _variables: ClassVar[dict[tuple[str, str], frozenset[str]]] = {}
+    _format_strings: ClassVar[dict[tuple[str, str], str]] = {}
+    _source_metadata: ClassVar[dict[str, _TemplateMetadata]] = {}
+    _key_variables: ClassVar[dict[str, frozenset[str] | None]] = {}
+    _compiled_languages: ClassVar[set[str]] = set()
+    _rendered: ClassVar[OrderedDict[tuple, str]] = OrderedDict()
+    
     def __init__(self):
-        # Templates por idioma
-        self._templates_pt = self._get_templates_pt()
-        self._templates_en = self._get_templates_en()
-        
-        # Carregadores por idioma
-        self._loaders = {
-            "pt-BR": TemplateLoader(self._templates_pt),
-            "en-US": TemplateLoader(self._templates_en),
-        }
-        
-        # Environments por idioma
-        self._envs = {}
-        for lang, loader in self._loaders.items():
-            self._envs[lang] = Environment(
-                loader=loader,
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-            # Filtros customizados
-            self._envs[lang].filters["kebab_case"] = self._kebab_case
-            self._envs[lang].filters["pascal_case"] = self._pascal_case
-            self._envs[lang].filters["snake_case"] = self._snake_case
+        if self._env is None:
+            self._build_shared()
+    
+    @property
+    def _templates_pt(self) -> Mapping[str, str]:
+        """Catálogo pt-BR (nome -> chave no loader); nada é lido ou compilado aqui"""
+        return self._template_keys["pt-BR"]
+    
+    @property
+    def _templates_en(self) -> Mapping[str, str]:
+        """Catálogo en-US (nome -> chave no loader); nada é lido ou compilado aqui"""
+        return self._template_keys["en-US"]
     
     def render(self, template_name: str, language: str = "pt-BR", **kwargs) -> str:
         """
@@ -79,1750 +439,222 @@ class TemplateEngine:
         Returns:
             Conteúdo renderizado
         """
+        template, format_string, context = self._prepare(template_name, language, kwargs)
+        
+        # Mesmo template, idioma e variáveis: reaproveita a saída
+        try:
+            key = (template_name, language, _freeze(context))
+        except TypeError:
+            key = None
+        else:
+            cached = self._rendered.get(key)
+            if cached is not None:
+                self._rendered.move_to_end(key)
+                return cached
+        
+        # Templates triviais dispensam o Jinja
+        if format_string is not None:
+            content = format_string.format_map(_FormatContext(context))
+        else:
+            content = template.render(context)
+        
+        if key is not None:
+            self._rendered[key] = content
+            if len(self._rendered) > _RENDER_CACHE_SIZE:
+                self._rendered.popitem(last=False)
+        
+        return content
+    
+    def stream(self, template_name: str, language: str = "pt-BR", **kwargs) -> Iterator[str]:
+        """
+        Renderiza um template em partes, sem montar a string completa
+        
+        Args:
+            template_name: Nome do template
+            language: Idioma do template (pt-BR, en-US)
+            **kwargs: Variáveis para o template
+            
+        Returns:
+            Iterador com as partes do conteúdo renderizado
+        """
+        template, format_string, context = self._prepare(template_name, language, kwargs)
+        return self._generate(template, format_string, context)
+    
+    def stream_all(
+        self,
+        template_names: Iterable[str],
+        language: str = "pt-BR",
+        **kwargs,
+    ) -> Iterator[tuple[str, Iterator[str]]]:
+        """
+        Renderiza vários templates em partes com um único contexto compartilhado
+        
+        Variáveis padrão, exemplos de convenções e blocos de lista são
+        montados uma vez; cada template recebe só as variáveis que usa.
+        Cada iterador deve ser consumido antes de avançar para o próximo.
+        
+        Args:
+            template_names: Nomes dos templates
+            language: Idioma dos templates (pt-BR, en-US)
+            **kwargs: Variáveis para os templates
+            
+        Yields:
+            Pares (nome do template, iterador com as partes do conteúdo)
+        """
         # Fallback para pt-BR se idioma não suportado
-        if language not in self._envs:
+        if language not in self._template_keys:
             language = self.DEFAULT_LANGUAGE
+        context = self._build_context(language, kwargs, None)
+        
+        for template_name in template_names:
+            template, language = self._resolve(template_name, language)
+            variables = self._variables.get((language, template_name))
+            yield template_name, self._generate(
+                template,
+                self._format_strings.get((language, template_name)),
+                _select(context, variables),
+            )
+    
+    @staticmethod
+    def _generate(
+        template: Template,
+        format_string: str | None,
+        context: dict[str, Any],
+    ) -> Iterator[str]:
+        """Gera as partes do conteúdo (templates triviais dispensam o Jinja)"""
+        if format_string is not None:
+            return iter((format_string.format_map(_FormatContext(context)),))
+        
+        return template.generate(context)
+    
+    def _prepare(
+        self,
+        template_name: str,
+        language: str,
+        kwargs: dict[str, Any],
+    ) -> tuple[Template, str | None, dict[str, Any]]:
+        """Resolve template, string de formatação (se trivial) e contexto de renderização"""
+        template, language = self._resolve(template_name, language)
+        variables = self._variables.get((language, template_name))
+        context = self._build_context(language, kwargs, variables)
+        
+        format_string = self._format_strings.get((language, template_name))
         
-        env = self._envs[language]
-        template = env.get_template(template_name)
+        return template, format_string, _select(context, variables)
+    
+    def _resolve(self, template_name: str, language: str) -> tuple[Template, str]:
+        """Resolve o template compilado e o idioma efetivo (com fallback)"""
+        template = self._compiled.get((language, template_name))
+        if template is None:
+            # Fallback para pt-BR se idioma não suportado
+            if language not in self._template_keys:
+                language = self.DEFAULT_LANGUAGE
+            self._compile_language(language)
+            # Nomes fora do catálogo seguem pelo loader do Jinja
+            template = self._compiled.get((language, template_name)) or self._env.get_template(
+                f"{language}/{template_name}"
+            )
+        return template, language
+    
+    @staticmethod
+    def _build_context(
+        language: str,
+        kwargs: dict[str, Any],
+        variables: frozenset[str] | None,
+    ) -> dict[str, Any]:
+        """Monta o contexto completo (variáveis padrão, exemplos e blocos de lista)"""
+        # Adiciona variáveis padrão (reaproveitadas dentro do mesmo segundo)
+        context = {**_default_context(int(time.time()), language), **kwargs}
+        
+        # Exemplos de convenções e listas simples são resolvidos aqui, não no template
+        if (variables is None or "examples" in variables) and "examples" not in context:
+            context["examples"] = convention_examples(context.get("convencoes"), language)
+        _prerender_lists(context, variables)
         
-        # Adiciona variáveis padrão
-        context = {
-            "now": datetime.now(),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "month": datetime.now().strftime("%Y-%m"),
-            "language": language,
+        return context
+    
+    @classmethod
+    def _build_shared(cls) -> None:
+        """Monta o Environment e os catálogos de todos os idiomas (sem compilar nada)"""
+        env = Environment(
+            loader=TemplateLoader(_TEMPLATE_DIR),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=False,
+            autoescape=False,
+            optimized=True,
+            extensions=(),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=_bytecode_cache(),
+        )
+        # Filtros customizados
+        env.filters.update(_FILTERS)
+        
+        # Catálogos somente leitura: são compartilhados por todas as instâncias
+        cls._template_keys = {
+            lang: MappingProxyType({name: f"{lang}/{name}" for name in TEMPLATE_NAMES})
+            for lang in cls.SUPPORTED_LANGUAGES
         }
-        context.update(kwargs)
+        cls._template_names = {lang: tuple(keys) for lang, keys in cls._template_keys.items()}
+        cls._env = env
+    
+    @classmethod
+    def _compile_language(cls, language: str) -> None:
+        """Pré-compila todos os templates do catálogo de um idioma (uma única vez)"""
+        if language in cls._compiled_languages:
+            return
+        for name, key in cls._template_keys[language].items():
+            cls._compiled[(language, name)] = cls._env.get_template(key)
+            variables = cls._find_variables(key)
+            if variables is not None:
+                cls._variables[(language, name)] = variables
+            format_string = cls._metadata(key).format_string
+            if format_string is not None:
+                cls._format_strings[(language, name)] = format_string
+        cls._compiled_languages.add(language)
+    
+    @classmethod
+    def _metadata(cls, key: str) -> _TemplateMetadata:
+        """Metadados de uma fonte do loader (memorizados por chave)"""
+        metadata = cls._source_metadata.get(key)
+        if metadata is None:
+            source, _, _ = cls._env.loader.get_source(cls._env, key)
+            metadata = cls._source_metadata[key] = _template_metadata(cls._env, source)
+        return metadata
+    
+    @classmethod
+    def _find_variables(cls, key: str) -> frozenset[str] | None:
+        """
+        Variáveis de contexto usadas por um template e pelos fragmentos que ele inclui
+        
+        Memorizado por chave: fragmentos incluídos por vários templates
+        (ex: "shared/_dod.md") são resolvidos uma única vez.
+        
+        Returns:
+            Nomes das variáveis, ou None se houver include dinâmico
+            (nesse caso o contexto completo é repassado)
+        """
+        if key in cls._key_variables:
+            return cls._key_variables[key]
         
-        return template.render(**context)
+        metadata = cls._metadata(key)
+        variables: frozenset[str] | None = None
+        if metadata.includes is not None:
+            variables = metadata.variables
+            for included in metadata.includes:
+                included_variables = cls._find_variables(included)
+                if included_variables is None:
+                    variables = None
+                    break
+                variables |= included_variables
+        
+        cls._key_variables[key] = variables
+        return variables
     
-    def list_templates(self, language: str = "pt-BR") -> list[str]:
+    def list_templates(self, language: str = "pt-BR") -> tuple[str, ...]:
         """Lista templates disponíveis para um idioma"""
-        lang = language if language in self._loaders else self.DEFAULT_LANGUAGE
-        return list(self._loaders[lang].templates.keys())
-    
-    def _kebab_case(self, value: str) -> str:
-        """Converte para kebab-case"""
-        return value.lower().replace(" ", "-").replace("_", "-")
-    
-    def _pascal_case(self, value: str) -> str:
-        """Converte para PascalCase"""
-        return "".join(word.capitalize() for word in value.replace("-", " ").replace("_", " ").split())
-    
-    def _snake_case(self, value: str) -> str:
-        """Converte para snake_case"""
-        return value.lower().replace(" ", "_").replace("-", "_")
-    
-    def _get_templates_pt(self) -> dict[str, str]:
-        """Retorna dicionário de templates em Português"""
-        return {
-            "readme-agent.md": self._readme_agent_template(),
-            "constituicao.md": self._constituicao_template(),
-            "kanban.md": self._kanban_template(),
-            "oraculo.md": self._oraculo_template(),
-            "politicas.md": self._politicas_template(),
-            "emergencia.md": self._emergencia_template(),
-            "indice-diario.md": self._indice_diario_template(),
-            "contexto-sessao.md": self._contexto_sessao_template(),
-            "AGENT.md": self._agent_template(),
-            "diario.md": self._diario_template(),
-        }
-    
-    def _get_templates_en(self) -> dict[str, str]:
-        """Retorna dicionário de templates em Inglês"""
-        return {
-            "readme-agent.md": self._readme_agent_template_en(),
-            "constituicao.md": self._constitution_template_en(),
-            "kanban.md": self._kanban_template_en(),
-            "oraculo.md": self._oracle_template_en(),
-            "politicas.md": self._policies_template_en(),
-            "emergencia.md": self._emergency_template_en(),
-            "indice-diario.md": self._diary_index_template_en(),
-            "contexto-sessao.md": self._session_context_template_en(),
-            "AGENT.md": self._agent_template_en(),
-            "diario.md": self._diary_template_en(),
-        }
-    
-    def _readme_agent_template(self) -> str:
-        """Template readme-agent.md v2.0"""
-        return '''# 👋 Bem-vindo! - {{ display_name }}
-
-> **🤖 Para o Agente de IA:** Este é seu guia completo. Leia atentamente antes de começar.
-
----
-
-## 🎯 Ritual de Inicialização
-
-Antes de qualquer ação, você DEVE:
-
-### 1️⃣ Confirmar Inicialização
-Responda exatamente:
-```
-✅ Agente inicializado para {{ display_name }}
-📅 {{ timestamp }}
-🎯 Modo: {{ agent_type }}
-```
-
-### 2️⃣ Executar Leitura Obrigatória
-Leia NA ORDEM:
-1. `doc/constituicao.md` - Princípios e proibições
-2. `doc/oraculo.md` - Decisões de arquitetura
-3. `doc/emergencia.md` - Bloqueios ativos
-4. `doc/kanban.md` - Tarefas disponíveis
-5. `doc/contexto-sessao.md` - Estado atual
-
-### 3️⃣ Preencher o Kanban Inicial
-> ⚠️ **Faça isso apenas se o `doc/kanban.md` ainda contiver placeholders (ex: `[Nome do Épico]`).**
-
-Com base na `doc/constituicao.md` que você acabou de ler, popule o `doc/kanban.md` com as tarefas reais do projeto:
-
-**a) Identifique os Épicos**
-Quebre o propósito do projeto em 3-6 grandes funcionalidades. Cada uma vira um ÉPICO.
-```
-ÉPICO-001: [Funcionalidade central 1]
-ÉPICO-002: [Funcionalidade central 2]
-...
-```
-
-**b) Crie as Tasks do Backlog**
-Para cada Épico, crie 2-5 tasks concretas e acionáveis:
-```
-TASK-001: [Ação específica] [ÉPICO-001]  → Complexidade M, Prioridade P0
-TASK-002: [Ação específica] [ÉPICO-001]  → Complexidade S, Prioridade P1
-...
-```
-
-**c) Regras ao preencher**
-- Use verbos no infinitivo: "Implementar", "Criar", "Configurar", "Integrar"
-- Mantenha tasks com escopo de 1-8h (use XL apenas se inevitável)
-- Defina critérios de aceitação claros e verificáveis
-- Priorize as tasks de infraestrutura/setup como P0
-
-**d) Atualize o Próximo ID**
-Após criar todas as tasks, atualize o campo `**Próximo ID:**` no topo do kanban.
-
-### 4️⃣ Registrar no Diário
-Crie entrada em `diario/{{ month }}.md`:
-```markdown
-### [{{ now.strftime("%H:%M") }}] BOOT - Agente iniciado
-**Contexto:** [Resumo do contexto-sessao.md]
-**Kanban:** [Quantos épicos/tasks foram criados ou já existiam]
-**Tarefa alvo:** TASK-XXX
-**Estado encontrado:** [O que está em progresso/bloqueado]
-```
-
----
-
-## 📋 Contexto do Projeto
-
-**Nome:** {{ display_name }}  
-**Tipo:** {{ agent_type }}  
-**Gerado:** {{ timestamp }}
-
-### 🎯 Missão
-{{ proposito }}
-
-### 🛠️ Stack Tecnológica
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Banco de Dados:** {{ stack.banco }}
-
-### 📜 Princípios (SEMPRE seguir)
-{% for principio in principios %}
-- {{ principio }}
-{% endfor %}
-
-### 🚫 Proibições (NUNCA fazer)
-{% for proibicao in proibicoes %}
-- {{ proibicao }}
-{% endfor %}
-
-### ✅ Definition of Done
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## 📊 Como Trabalhar com o Kanban
-
-### Hierarquia de Tarefas
-
-```
-ÉPICO (Grande funcionalidade)
-└── TASK (Unidade de trabalho)
-    └── SUBTAREFA (Passo específico)
-```
-
-### Fluxo de Trabalho
-
-1. **ESCOLHER** tarefa do BACKLOG
-2. **MOVER** para EM PROGRESSO (atualize kanban.md)
-3. **CRIAR** subtarefas se necessário
-4. **COMMITAR** com referência: `feat(auth): add login [TASK-001]`
-5. **ATUALIZAR** contexto-sessao.md ao final
-6. **MOVER** para CONCLUÍDO quando pronto
-
-### Regras de Ouro
-- ✅ Sempre vincule trabalho a TASK-ID
-- ✅ Atualize kanban ANTES de começar
-- ✅ Crie subtarefas para trabalho > 2h
-- ✅ Referencie task no commit
-
----
-
-## 🚨 Regras de Ouro
-
-1. **NUNCA** programe antes de ler a Constituição
-2. **NUNCA** ignore `emergencia.md`
-3. **SEMPRE** vincule a TASK-ID
-4. **SEMPRE** atualize `contexto-sessao.md`
-5. **SEMPRE** registre no diário
-
----
-
-## 🆘 Em Caso de Dúvida
-
-| Dúvida sobre | Consulte |
-|--------------|----------|
-| Arquitetura | `doc/oraculo.md` |
-| Regras | `doc/constituicao.md` |
-| Convenções | `doc/politicas.md` |
-| Tarefas | `doc/kanban.md` |
-| Bloqueios | `doc/emergencia.md` |
-
-**Se ainda tiver dúvida:** Registre em `emergencia.md` ANTES de prosseguir.
-
----
-
-*Gerado com 🦑 Squidy v{{ version }} em {{ timestamp }}*
-'''
-    
-    def _constituicao_template(self) -> str:
-        """Template constituicao.md v2.0"""
-        return '''# CONSTITUIÇÃO - {{ display_name }}
-
-**Gerado em:** {{ timestamp }}  
-**Tipo de Agente:** {{ agent_type }}
-
----
-
-## §1 - PROPÓSITO (Por que este projeto existe?)
-
-{{ proposito }}
-
-{% if contexto_negocio %}
-### Contexto de Negócio
-- **Problema:** {{ contexto_negocio.problema }}
-- **Usuários Alvo:** {{ contexto_negocio.usuarios_alvo }}
-- **Valor Principal:** {{ contexto_negocio.valor_principal }}
-{% endif %}
-
----
-
-## §2 - PRINCÍPIOS (O que SEMPRE fazer)
-
-{% for principio in principios %}
-### {{ loop.index }}. {{ principio }}
-
-**✅ FAZER:**
-- [Ação específica relacionada]
-
-**❌ EVITAR:**
-- [Anti-padrão comum]
-
-{% endfor %}
-
----
-
-## §3 - PROIBIÇÕES (O que NUNCA fazer)
-
-{% for proibicao in proibicoes %}
-### {{ loop.index }}. {{ proibicao }}
-
-**Por quê:** [Explicação do risco]  
-**Consequência:** [O que acontece se quebrar]  
-**Como detectar:** [Como identificar]  
-**Exceção:** [Quando pode quebrar, se aplicável]
-
-{% endfor %}
-
----
-
-## §4 - CONVENÇÕES
-
-### Nomenclatura
-
-| Elemento | Convenção | Exemplo |
-|----------|-----------|---------|
-| Variáveis | {{ convencoes.variaveis }} | `{% if convencoes.variaveis == "camelCase" %}usuarioAtual{% else %}usuario_atual{% endif %}` |
-| Funções | {{ convencoes.funcoes }} | `{% if convencoes.funcoes == "camelCase" %}calcularTotal{% else %}calcular_total{% endif %}()` |
-| Classes | {{ convencoes.classes }} | `{% if convencoes.classes == "PascalCase" %}UsuarioService{% else %}usuario_service{% endif %}` |
-| Constantes | {{ convencoes.constantes }} | `{% if convencoes.constantes == "UPPER_SNAKE" %}MAX_TENTATIVAS{% else %}max_tentativas{% endif %}` |
-| Arquivos | {{ convencoes.arquivos }} | `{% if convencoes.arquivos == "kebab-case" %}usuario-service{% else %}usuario_service{% endif %}.js` |
-| Banco | {{ convencoes.banco }} | `{% if convencoes.banco == "snake_case" %}usuario_id{% else %}usuarioId{% endif %}` |
-
-### Commits (Conventional Commits)
-
-```
-tipo(escopo): descrição curta
-
-[corpo opcional]
-
-[rodapé opcional]
-```
-
-**Tipos:**
-- `feat`: Nova funcionalidade
-- `fix`: Correção de bug
-- `docs`: Documentação
-- `test`: Testes
-- `refactor`: Refatoração
-- `chore`: Tarefas diversas
-
----
-
-## §5 - DEFINITION OF DONE
-
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## §6 - STACK TECNOLÓGICA
-
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Banco de Dados:** {{ stack.banco }}
-
-{% if arquitetura %}
-### Arquitetura
-- **Padrão:** {{ arquitetura.padrao }}
-- **Camadas:** {{ arquitetura.camadas | join(", ") }}
-{% if arquitetura.integracoes %}
-- **Integrações:** {{ arquitetura.integracoes | join(", ") }}
-{% endif %}
-{% endif %}
-
-{% if qualidade %}
-### Qualidade
-- **Cobertura de Testes:** {{ qualidade.cobertura_testes }}
-- **Ferramentas:** {{ qualidade.ferramentas | join(", ") }}
-- **CI/CD:** {{ "Sim" if qualidade.ci_cd else "Não" }}
-{% endif %}
-
----
-
-*Gerado automaticamente pelo 🦑 Squidy v{{ version }}*
-'''
-    
-    def _kanban_template(self) -> str:
-        """Template kanban.md v2.0"""
-        return '''# KANBAN - {{ display_name }}
-
-**Gerado em:** {{ timestamp }}
-**Próximo ID:** TASK-001
-
----
-
-> ## 🤖 INSTRUÇÃO PARA O AGENTE — SETUP INICIAL
->
-> **Este arquivo foi gerado com placeholders.** Na primeira sessão do projeto, você deve substituí-los por tarefas reais antes de qualquer desenvolvimento.
->
-> ### Como preencher:
-> 1. **Leia `doc/constituicao.md`** para entender o propósito e escopo do projeto
-> 2. **Identifique 3-6 Épicos** — grandes funcionalidades que compõem o produto
-> 3. **Para cada Épico, crie 2-5 Tasks** no BACKLOG com:
->    - Nome em verbo no infinitivo (`Implementar`, `Configurar`, `Criar`...)
->    - Complexidade realista (XS/S/M/L — evite XL)
->    - Critérios de aceitação verificáveis
->    - Prioridade (P0 = bloqueia release, P1 = importante, P2 = desejável)
-> 4. **Remova os placeholders** (`[Nome do Épico]`, `[Nome da Task]`, etc.)
-> 5. **Atualize o campo `Próximo ID`** no cabeçalho deste arquivo
->
-> ⚠️ **Não comece a desenvolver antes de preencher o kanban.**
-
----
-
-## 📋 GUIA RÁPIDO
-
-### Hierarquia
-- **ÉPICO** → Funcionalidade grande (ex: "Sistema de Auth")
-- **TASK** → Unidade de trabalho (ex: "Login com JWT")
-- **SUBTAREFA** → Passo específico (ex: "Criar endpoint")
-
-### Prioridades
-- **P0** → Crítico (bloqueia release)
-- **P1** → Alto (importante)
-- **P2** → Médio (desejável)
-- **P3** → Baixo (nice to have)
-
-### Complexidade
-- **XS** → < 1h
-- **S** → 1-2h
-- **M** → 2-4h
-- **L** → 4-8h
-- **XL** → > 8h (quebrar em tasks menores)
-
----
-
-## 🔥 ÉPICOS
-
-### ÉPICO-001: [Nome do Épico]
-**Descrição:** [Descrição curta]  
-**Prioridade:** P0  
-**Complexidade:** M  
-**Critérios de Aceitação:**
-- [ ] Critério 1
-- [ ] Critério 2
-
-**Tasks Relacionadas:**
-- [ ] TASK-001
-- [ ] TASK-002
-
----
-
-## 📋 BACKLOG
-
-### TASK-001: [Nome da Task] [ÉPICO-001]
-**Complexidade:** M  
-**Prioridade:** P0  
-**Tempo Estimado:** 4h  
-**Descrição:** [Descrição detalhada]
-
-**Critérios de Aceitação:**
-- [ ] Critério 1
-- [ ] Critério 2
-
-**Subtarefas:**
-- [ ] SUB-001: [Descrição] (XS - 30min)
-- [ ] SUB-002: [Descrição] (S - 1h)
-
-**Notas:**
-- [Informações adicionais]
-
----
-
-## 🏗️ EM PROGRESSO (WIP: 0/3)
-
-*[Mover tasks do BACKLOG para cá antes de começar]*
-
----
-
-## ✅ CONCLUÍDO
-
-- [x] **TASK-000** Setup inicial do projeto Squidy
-  - **Concluído em:** {{ timestamp }}
-  - **Agente:** Squidy Setup
-  - **Notas:** Estrutura inicial gerada automaticamente
-
----
-
-## ⏸️ BLOQUEADO
-
-*[Registrar bloqueios com motivo e data]*
-
----
-
-## 📊 MÉTRICAS
-
-- **WIP:** 0/3 (limite: 3 tarefas simultâneas)
-- **Velocidade:** Calculando...
-- **Taxa de Conclusão:** Calculando...
-- **Bloqueios:** 0
-- **Próximo ID:** TASK-001
-
----
-
-*Mantenha este kanban atualizado - mova tarefas conforme progresso*
-'''
-    
-    def _oraculo_template(self) -> str:
-        """Template oraculo.md"""
-        return '''# ORÁCULO - Decisões de Arquitetura (ADRs)
-
-**Projeto:** {{ display_name }}  
-**Gerado em:** {{ timestamp }}
-
----
-
-## ADR-001: Stack Técnica Principal
-
-**Data:** {{ date }}  
-**Status:** Aceito  
-**Contexto:** Definição da stack tecnológica baseada nos requisitos do projeto.
-
-**Decisão:**
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Banco de Dados:** {{ stack.banco }}
-
-**Consequências:**
-- ✅ Stack alinhada com requisitos do projeto
-- ✅ Ferramentas e bibliotecas bem estabelecidas
-- ⚠️ Equipe precisa de conhecimento nas tecnologias escolhidas
-
-{% if arquitetura %}
-### Detalhes da Arquitetura
-- **Padrão:** {{ arquitetura.padrao }}
-- **Camadas:** {{ arquitetura.camadas | join(", ") }}
-{% if arquitetura.integracoes %}
-- **Integrações:** {{ arquitetura.integracoes | join(", ") }}
-{% endif %}
-{% endif %}
-
----
-
-## ADR-002: Restrições Técnicas
-
-**Data:** {{ date }}  
-**Status:** Aceito
-
-**Restrições identificadas:**
-{% for restricao in restricoes %}
-- {{ restricao }}
-{% else %}
-- Nenhuma restrição técnica específica definida
-{% endfor %}
-
-**Consequências:**
-- ✅ Requisitos não-funcionais documentados
-- ⚠️ Podem impactar escolhas de implementação futuras
-
----
-
-## ADR-003: Convenções de Código
-
-**Data:** {{ date }}  
-**Status:** Aceito
-
-**Decisão:** Adotar as seguintes convenções:
-
-| Elemento | Convenção |
-|----------|-----------|
-| Variáveis | {{ convencoes.variaveis }} |
-| Funções | {{ convencoes.funcoes }} |
-| Classes | {{ convencoes.classes }} |
-| Constantes | {{ convencoes.constantes }} |
-| Arquivos | {{ convencoes.arquivos }} |
-| Banco | {{ convencoes.banco }} |
-
-**Motivação:** Manter consistência e legibilidade do código.
-
----
-
-*Adicione novos ADRs conforme decisões importantes forem tomadas*
-'''
-    
-    def _politicas_template(self) -> str:
-        """Template politicas.md"""
-        return '''# POLÍTICAS - {{ display_name }}
-
-**Gerado em:** {{ timestamp }}
-
----
-
-## 🔧 Políticas de Desenvolvimento
-
-### Commits e Versionamento
-
-- **Convenção:** Conventional Commits (feat:, fix:, docs:, etc)
-- **Branches:**
-  - `main` → Produção
-  - `develop` → Desenvolvimento
-  - `feature/*` → Funcionalidades
-  - `hotfix/*` → Correções urgentes
-- **Pull Requests:** Obrigatórios para merge em `main`
-
-### Code Review
-
-- **Mínimo de aprovações:** 1 revisor
-- **Checklist de Review:**
-  - [ ] Código segue padrões do projeto
-  - [ ] Testes adequados incluídos
-  - [ ] Documentação atualizada
-  - [ ] Sem credenciais ou secrets hardcoded
-
-### Testes
-
-{% if qualidade %}
-- **Cobertura mínima:** {{ qualidade.cobertura_testes }}
-- **Ferramentas:** {{ qualidade.ferramentas | join(", ") }}
-{% else %}
-- **Cobertura mínima:** 70%
-- **Tipos:** Unitários (obrigatórios), Integração (quando aplicável)
-{% endif %}
-- **CI/CD:** Testes devem passar antes de merge
-
----
-
-## 📦 Políticas de Deploy
-
-### Ambientes
-
-- **Development:** Deploy automático de `develop`
-- **Staging:** Deploy manual para validação
-- **Production:** Deploy após aprovação e testes em staging
-
-### Rollback
-
-- Manter última versão funcional sempre deployável
-- Procedure de rollback documentado
-- Feature flags para funcionalidades críticas
-
----
-
-## 🔒 Políticas de Segurança
-
-### Credenciais
-
-- ❌ NUNCA commitar API keys, tokens, passwords
-- ✅ Usar variáveis de ambiente ou secret managers
-- ✅ Rotacionar secrets regularmente
-- ✅ Usar `.env.example` sem valores reais
-
-### Dependências
-
-- Revisar dependências antes de adicionar
-- Manter dependências atualizadas (security patches)
-- Usar ferramentas de scan de vulnerabilidades (Dependabot, Snyk)
-
-### Código
-
-- Validar inputs em todas as APIs
-- Usar prepared statements para SQL
-- Escapar outputs em templates
-- Implementar rate limiting
-
----
-
-*Políticas podem ser ajustadas conforme o projeto evolui*
-'''
-    
-    def _emergencia_template(self) -> str:
-        """Template emergencia.md"""
-        return '''# EMERGÊNCIA - {{ display_name }}
-
-**Última atualização:** {{ timestamp }}
-
----
-
-## 🚨 Bloqueios Ativos
-
-*Nenhum bloqueio registrado no momento*
-
----
-
-## 📋 Template de Registro de Bloqueio
-
-### BLOCK-XXX: [Título do bloqueio]
-
-**Data:** YYYY-MM-DD HH:MM  
-**Severidade:** 🔴 Crítico | 🟡 Importante | 🟢 Baixa  
-**Impacto:** Qual tarefa/funcionalidade está bloqueada?
-
-**Descrição:**
-Detalhe o problema encontrado.
-
-**Tentativas de Resolução:**
-1. O que já foi tentado?
-2. Por que não funcionou?
-
-**Contexto Adicional:**
-- Logs relevantes
-- Mensagens de erro
-- Configurações envolvidas
-
-**Resolução:**
-*A ser preenchido quando resolvido*
-
----
-
-## 📚 Bloqueios Resolvidos
-
-### BLOCK-000: Exemplo de bloqueio resolvido
-
-**Data:** {{ timestamp }}  
-**Severidade:** 🟢 Baixa  
-**Resolução:** Este é apenas um exemplo para ilustrar o formato
-
----
-
-*Use este arquivo apenas para bloqueios que impedem progresso - não para bugs comuns*
-'''
-    
-    def _indice_diario_template(self) -> str:
-        """Template indice-diario.md"""
-        return '''# ÍNDICE DO DIÁRIO - {{ display_name }}
-
----
-
-## 📅 Arquivos de Diário
-
-### {{ now.strftime("%Y") }}
-
-- [{{ month }}.md](../diario/{{ month }}.md) - Ativo
-
----
-
-## 🔍 Busca Rápida
-
-### Por Tipo de Entrada
-
-- **Decisões importantes:** Busque por "DECISÃO:" no diário
-- **Problemas resolvidos:** Busque por "RESOLVIDO:"
-- **Bloqueios:** Veja `emergencia.md`
-- **Refatorações:** Busque por "REFACTOR:"
-
-### Por Tarefa
-
-- **TASK-XXX:** Use o ID da tarefa como palavra-chave
-- **ÉPICO-XXX:** Busque pelo ID do épico
-
----
-
-## 📝 Como Registrar no Diário
-
-### Formato Padrão
-
-```markdown
-### [HH:MM] TASK-XXX - Título curto
-
-**Contexto:** [O que estava fazendo]
-
-**Ação:** [O que foi feito]
-
-**Resultado:** [O que aconteceu]
-
-**Próximos passos:** [O que falta fazer]
-
-**Notas:** [Informações adicionais]
-```
-
-### Exemplos
-
-```markdown
-### [14:30] TASK-001 - Setup JWT
-
-**Contexto:** Iniciando implementação de autenticação
-
-**Ação:** Instalei biblioteca jsonwebtoken e configurei middleware
-
-**Resultado:** Middleware criado e testado localmente
-
-**Próximos passos:** Criar endpoint /login
-
-**Notas:** Usar algoritmo RS256 em produção
-```
-
----
-
-*Este índice é atualizado automaticamente conforme novos arquivos são criados*
-'''
-    
-    def _contexto_sessao_template(self) -> str:
-        """Template contexto-sessao.md"""
-        return '''# CONTEXTO DE SESSÃO - {{ display_name }}
-
-**Gerado em:** {{ timestamp }}  
-**Agente:** setup-squidy-ai  
-**Tarefa Atual:** TASK-001  
-**Fase:** Planejamento/Setup Inicial
-
----
-
-## 📊 Estado Atual (Resumo Executivo)
-
-Projeto "{{ display_name }}" foi configurado com sucesso usando o Squidy Setup AI.
-
-**Stack Técnica:**
-- Frontend: {{ stack.frontend }}
-- Backend: {{ stack.backend }}
-- Banco: {{ stack.banco }}
-
-**Bloqueios:** Nenhum  
-**Dependências:** Conforme stack escolhida
-
----
-
-## 📚 Referências Rápidas
-
-- **Constituição:** Revisar propósito e princípios antes de começar
-- **Oráculo:** ADR-001 define stack técnica
-- **Políticas:** Seguir convenções de commit e code review
-- **Kanban:** TASK-001 disponível para início
-
----
-
-## 🧠 Memória de Curto Prazo
-
-1. Projeto configurado automaticamente via entrevista AI
-2. Estrutura Squidy completa gerada
-3. Pronto para desenvolvimento começar
-
----
-
-## ⚠️ Alertas Ativos
-
-🔔 **LEMBRETE:** Revisar e ajustar configurações conforme necessidade  
-🔔 **ATENÇÃO:** Adicionar primeira tarefa real ao kanban (substituir TASK-001)
-
----
-
-## 🎯 Próxima Ação Esperada
-
-Revisar estrutura e começar desenvolvimento da TASK-001
-
----
-
-*Atualize este arquivo ao final de cada sessão de trabalho*
-'''
-    
-    def _agent_template(self) -> str:
-        """Template AGENT.md (referência rápida)"""
-        return '''# AGENT - Referência Rápida
-
-**Projeto:** {{ display_name }}  
-**Tipo:** {{ agent_type }}  
-**Gerado:** {{ timestamp }}
-
----
-
-## 🎯 Quem Você É
-
-{{ agent_type.replace("-", " ").title() }} responsável por {{ display_name }}
-
-## 🎯 Missão
-
-{{ proposito }}
-
----
-
-## 📜 Regras (SEMPRE seguir)
-
-{% for principio in principios %}
-- {{ principio }}
-{% endfor %}
-
----
-
-## 🚫 Proibições (NUNCA fazer)
-
-{% for proibicao in proibicoes %}
-- {{ proibicao }}
-{% endfor %}
-
----
-
-## ✅ Definition of Done
-
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## 🛠️ Stack
-
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Banco:** {{ stack.banco }}
-
----
-
-## 🧭 Navegação Rápida
-
-| Arquivo | Conteúdo |
-|---------|----------|
-| `constituicao.md` | Princípios e proibições completos |
-| `oraculo.md` | Decisões arquiteturais (ADRs) |
-| `politicas.md` | Convenções de código e deploy |
-| `kanban.md` | Tarefas em aberto |
-| `emergencia.md` | Bloqueios críticos |
-| `contexto-sessao.md` | Estado atual do projeto |
-
----
-
-*Para inicialização completa, leia `../readme-agent.md` na raiz*
-'''
-    
-    def _diario_template(self) -> str:
-        """Template diário mensal"""
-        return '''# DIÁRIO - {{ display_name }} - {{ month }}
-
----
-
-## {{ date }}
-
-### Setup Inicial do Projeto
-
-**Timestamp:** {{ timestamp }}  
-**Agente:** squidy-setup-ai  
-**Ação:** Geração automática da estrutura Squidy v2.0  
-**Contexto:** Projeto configurado via entrevista interativa com IA
-
-**Decisões tomadas:**
-- Stack técnica definida: {{ stack.frontend }} + {{ stack.backend }} + {{ stack.banco }}
-- Tipo de agente: {{ agent_type }}
-- Propósito documentado na Constituição
-- {{ principios | length }} princípios definidos
-- {{ proibicoes | length }} proibições estabelecidas
-
-**Próximos passos:**
-1. Revisar arquivos gerados (especialmente `constituicao.md`)
-2. Ajustar `kanban.md` com tarefas reais do projeto
-3. Configurar ambiente de desenvolvimento
-4. Começar TASK-001
-
----
-
-*Formato: ### [HH:MM] TASK-XXX - Descrição*
-'''
-
-    
-    # =========================================================================
-    # ENGLISH TEMPLATES (v2.0)
-    # =========================================================================
-    
-    def _readme_agent_template_en(self) -> str:
-        """Template readme-agent.md v2.0 - English"""
-        return '''# 👋 Welcome! - {{ display_name }}
-
-> **🤖 For the AI Agent:** This is your complete guide. Read carefully before starting.
-
----
-
-## 🎯 Initialization Ritual
-
-Before any action, you MUST:
-
-### 1️⃣ Confirm Initialization
-Respond exactly:
-```
-✅ Agent initialized for {{ display_name }}
-📅 {{ timestamp }}
-🎯 Mode: {{ agent_type }}
-```
-
-### 2️⃣ Execute Required Reading
-Read IN ORDER:
-1. `doc/constitution.md` - Principles and prohibitions
-2. `doc/oracle.md` - Architecture decisions
-3. `doc/emergency.md` - Active blockers
-4. `doc/kanban.md` - Available tasks
-5. `doc/session-context.md` - Current state
-
-### 3️⃣ Fill Initial Kanban
-> ⚠️ **Only do this if `doc/kanban.md` still contains placeholders (e.g., `[Epic Name]`).**
-
-Based on `doc/constitution.md` you just read, populate `doc/kanban.md` with real project tasks:
-
-**a) Identify Epics**
-Break down the project purpose into 3-6 major features. Each becomes an EPIC.
-```
-EPIC-001: [Core feature 1]
-EPIC-002: [Core feature 2]
-...
-```
-
-**b) Create Backlog Tasks**
-For each Epic, create 2-5 concrete, actionable tasks:
-```
-TASK-001: [Specific action] [EPIC-001]  → Complexity M, Priority P0
-TASK-002: [Specific action] [EPIC-001]  → Complexity S, Priority P1
-...
-```
-
-**c) Rules when filling**
-- Use infinitive verbs: "Implement", "Create", "Configure", "Integrate"
-- Keep tasks with 1-8h scope (use XL only if inevitable)
-- Define clear, verifiable acceptance criteria
-- Prioritize infrastructure/setup tasks as P0
-
-**d) Update Next ID**
-After creating all tasks, update the `**Next ID:**` field at the top of the kanban.
-
-### 4️⃣ Register in Diary
-Create entry in `diary/{{ month }}.md`:
-```markdown
-### [{{ now.strftime("%H:%M") }}] BOOT - Agent started
-**Context:** [Summary from session-context.md]
-**Kanban:** [How many epics/tasks were created or already existed]
-**Target task:** TASK-XXX
-**State found:** [What's in progress/blocked]
-```
-
----
-
-## 📋 Project Context
-
-**Name:** {{ display_name }}  
-**Type:** {{ agent_type }}  
-**Generated:** {{ timestamp }}
-
-### 🎯 Mission
-{{ proposito }}
-
-### 🛠️ Technology Stack
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Database:** {{ stack.banco }}
-
-### 📜 Principles (ALWAYS follow)
-{% for principio in principios %}
-- {{ principio }}
-{% endfor %}
-
-### 🚫 Prohibitions (NEVER do)
-{% for proibicao in proibicoes %}
-- {{ proibicao }}
-{% endfor %}
-
-### ✅ Definition of Done
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## 📊 How to Work with the Kanban
-
-### Task Hierarchy
-
-```
-EPIC (Major feature)
-└── TASK (Work unit)
-    └── SUBTASK (Specific step)
-```
-
-### Workflow
-
-1. **CHOOSE** task from BACKLOG
-2. **MOVE** to IN PROGRESS (update kanban.md)
-3. **CREATE** subtasks if needed
-4. **COMMIT** with reference: `feat(auth): add login [TASK-001]`
-5. **UPDATE** session-context.md at the end
-6. **MOVE** to COMPLETED when done
-
-### Golden Rules
-- ✅ Always link work to TASK-ID
-- ✅ Update kanban BEFORE starting
-- ✅ Create subtasks for work > 2h
-- ✅ Reference task in commit
-
----
-
-## 🚨 Golden Rules
-
-1. **NEVER** code before reading the Constitution
-2. **NEVER** ignore `emergency.md`
-3. **ALWAYS** link to TASK-ID
-4. **ALWAYS** update `session-context.md`
-5. **ALWAYS** register in diary
-
----
-
-## 🆘 In Case of Doubt
-
-| Doubt about | Consult |
-|-------------|---------|
-| Architecture | `doc/oracle.md` |
-| Rules | `doc/constitution.md` |
-| Conventions | `doc/policies.md` |
-| Tasks | `doc/kanban.md` |
-| Blockers | `doc/emergency.md` |
-
-**If still in doubt:** Register in `emergency.md` BEFORE proceeding.
-
----
-
-*Generated with 🦑 Squidy v{{ version }} at {{ timestamp }}*
-'''
-    
-    def _constitution_template_en(self) -> str:
-        """Template constitution.md v2.0 - English"""
-        return '''# CONSTITUTION - {{ display_name }}
-
-**Generated at:** {{ timestamp }}  
-**Agent Type:** {{ agent_type }}
-
----
-
-## §1 - PURPOSE (Why does this project exist?)
-
-{{ proposito }}
-
-{% if contexto_negocio %}
-### Business Context
-- **Problem:** {{ contexto_negocio.problema }}
-- **Target Users:** {{ contexto_negocio.usuarios_alvo }}
-- **Main Value:** {{ contexto_negocio.valor_principal }}
-{% endif %}
-
----
-
-## §2 - PRINCIPLES (What to ALWAYS do)
-
-{% for principio in principios %}
-### {{ loop.index }}. {{ principio }}
-
-**✅ DO:**
-- [Specific related action]
-
-**❌ AVOID:**
-- [Common anti-pattern]
-
-{% endfor %}
-
----
-
-## §3 - PROHIBITIONS (What to NEVER do)
-
-{% for proibicao in proibicoes %}
-### {{ loop.index }}. {{ proibicao }}
-
-**Why:** [Risk explanation]  
-**Consequence:** [What happens if broken]  
-**How to detect:** [How to identify]  
-**Exception:** [When it can be broken, if applicable]
-
-{% endfor %}
-
----
-
-## §4 - CONVENTIONS
-
-### Naming
-
-| Element | Convention | Example |
-|---------|------------|---------|
-| Variables | {{ convencoes.variaveis }} | `{% if convencoes.variaveis == "camelCase" %}currentUser{% else %}current_user{% endif %}` |
-| Functions | {{ convencoes.funcoes }} | `{% if convencoes.funcoes == "camelCase" %}calculateTotal{% else %}calculate_total{% endif %}()` |
-| Classes | {{ convencoes.classes }} | `{% if convencoes.classes == "PascalCase" %}UserService{% else %}user_service{% endif %}` |
-| Constants | {{ convencoes.constantes }} | `{% if convencoes.constantes == "UPPER_SNAKE" %}MAX_RETRIES{% else %}max_retries{% endif %}` |
-| Files | {{ convencoes.arquivos }} | `{% if convencoes.arquivos == "kebab-case" %}user-service{% else %}user_service{% endif %}.js` |
-| Database | {{ convencoes.banco }} | `{% if convencoes.banco == "snake_case" %}user_id{% else %}userId{% endif %}` |
-
-### Commits (Conventional Commits)
-
-```
-type(scope): short description
-
-[optional body]
-
-[optional footer]
-```
-
-**Types:**
-- `feat`: New feature
-- `fix`: Bug fix
-- `docs`: Documentation
-- `test`: Tests
-- `refactor`: Refactoring
-- `chore`: Miscellaneous tasks
-
----
-
-## §5 - DEFINITION OF DONE
-
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## §6 - TECHNOLOGY STACK
-
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Database:** {{ stack.banco }}
-
-{% if arquitetura %}
-### Architecture
-- **Pattern:** {{ arquitetura.padrao }}
-- **Layers:** {{ arquitetura.camadas | join(", ") }}
-{% if arquitetura.integracoes %}
-- **Integrations:** {{ arquitetura.integracoes | join(", ") }}
-{% endif %}
-{% endif %}
-
-{% if qualidade %}
-### Quality
-- **Test Coverage:** {{ qualidade.cobertura_testes }}
-- **Tools:** {{ qualidade.ferramentas | join(", ") }}
-- **CI/CD:** {{ "Yes" if qualidade.ci_cd else "No" }}
-{% endif %}
-
----
-
-*Generated automatically by 🦑 Squidy v{{ version }}*
-'''
-
-    
-    def _kanban_template_en(self) -> str:
-        """Template kanban.md v2.0 - English"""
-        return '''# KANBAN - {{ display_name }}
-
-**Generated at:** {{ timestamp }}
-**Next ID:** TASK-001
-
----
-
-> ## 🤖 AGENT INSTRUCTION — INITIAL SETUP
->
-> **This file was generated with placeholders.** In the first project session, you must replace them with real tasks before any development.
->
-> ### How to fill:
-> 1. **Read `doc/constitution.md`** to understand the project purpose and scope
-> 2. **Identify 3-6 Epics** — major features that compose the product
-> 3. **For each Epic, create 2-5 Tasks** in the BACKLOG with:
->    - Name in infinitive verb (\`Implement\`, \`Configure\`, \`Create\`...)
->    - Realistic complexity (XS/S/M/L — avoid XL)
->    - Verifiable acceptance criteria
->    - Priority (P0 = blocks release, P1 = important, P2 = desirable)
-> 4. **Remove placeholders** (\`[Epic Name]\`, \`[Task Name]\`, etc.)
-> 5. **Update the \`Next ID\`** field in the header of this file
->
-> ⚠️ **Don't start developing before filling the kanban.**
-
----
-
-## 📋 QUICK GUIDE
-
-### Hierarchy
-- **EPIC** → Major feature (ex: "Auth System")
-- **TASK** → Work unit (ex: "JWT Login")
-- **SUBTASK** → Specific step (ex: "Create endpoint")
-
-### Priorities
-- **P0** → Critical (blocks release)
-- **P1** → High (important)
-- **P2** → Medium (desirable)
-- **P3** → Low (nice to have)
-
-### Complexity
-- **XS** → < 1h
-- **S** → 1-2h
-- **M** → 2-4h
-- **L** → 4-8h
-- **XL** → > 8h (break into smaller tasks)
-
----
-
-## 🔥 EPICS
-
-### EPIC-001: [Epic Name]
-**Description:** [Short description]  
-**Priority:** P0  
-**Complexity:** M  
-**Acceptance Criteria:**
-- [ ] Criterion 1
-- [ ] Criterion 2
-
-**Related Tasks:**
-- [ ] TASK-001
-- [ ] TASK-002
-
----
-
-## 📋 BACKLOG
-
-### TASK-001: [Task Name] [EPIC-001]
-**Complexity:** M  
-**Priority:** P0  
-**Estimated Time:** 4h  
-**Description:** [Detailed description]
-
-**Acceptance Criteria:**
-- [ ] Criterion 1
-- [ ] Criterion 2
-
-**Subtasks:**
-- [ ] SUB-001: [Description] (XS - 30min)
-- [ ] SUB-002: [Description] (S - 1h)
-
-**Notes:**
-- [Additional information]
-
----
-
-## 🏗️ IN PROGRESS (WIP: 0/3)
-
-*[Move tasks from BACKLOG here before starting]*
-
----
-
-## ✅ COMPLETED
-
-- [x] **TASK-000** Initial Squidy project setup
-  - **Completed at:** {{ timestamp }}
-  - **Agent:** Squidy Setup
-  - **Notes:** Initial structure automatically generated
-
----
-
-## ⏸️ BLOCKED
-
-*[Register blockers with reason and date]*
-
----
-
-## 📊 METRICS
-
-- **WIP:** 0/3 (limit: 3 simultaneous tasks)
-- **Velocity:** Calculating...
-- **Completion Rate:** Calculating...
-- **Blockers:** 0
-- **Next ID:** TASK-001
-
----
-
-*Keep this kanban updated — move tasks as progress happens*
-'''
-    
-    def _oracle_template_en(self) -> str:
-        """Template oracle.md (ADRs) - English"""
-        return '''# ORACLE - Architecture Decisions (ADRs)
-
-**Project:** {{ display_name }}  
-**Generated at:** {{ timestamp }}
-
----
-
-## ADR-001: Main Technology Stack
-
-**Date:** {{ date }}  
-**Status:** Accepted  
-**Context:** Definition of technology stack based on project requirements.
-
-**Decision:**
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Database:** {{ stack.banco }}
-
-**Consequences:**
-- ✅ Stack aligned with project requirements
-- ✅ Well-established tools and libraries
-- ⚠️ Team needs knowledge in chosen technologies
-
-{% if arquitetura %}
-### Architecture Details
-- **Pattern:** {{ arquitetura.padrao }}
-- **Layers:** {{ arquitetura.camadas | join(", ") }}
-{% if arquitetura.integracoes %}
-- **Integrations:** {{ arquitetura.integracoes | join(", ") }}
-{% endif %}
-{% endif %}
-
----
-
-## ADR-002: Technical Restrictions
-
-**Date:** {{ date }}  
-**Status:** Accepted
-
-**Identified Restrictions:**
-{% for restricao in restricoes %}
-- {{ restricao }}
-{% else %}
-- No specific technical restrictions defined
-{% endfor %}
-
-**Consequences:**
-- ✅ Non-functional requirements documented
-- ⚠️ May impact future implementation choices
-
----
-
-## ADR-003: Code Conventions
-
-**Date:** {{ date }}  
-**Status:** Accepted
-
-**Decision:** Adopt the following conventions:
-
-| Element | Convention |
-|---------|------------|
-| Variables | {{ convencoes.variaveis }} |
-| Functions | {{ convencoes.funcoes }} |
-| Classes | {{ convencoes.classes }} |
-| Constants | {{ convencoes.constantes }} |
-| Files | {{ convencoes.arquivos }} |
-| Database | {{ convencoes.banco }} |
-
-**Motivation:** Maintain code consistency and readability.
-
----
-
-*Add new ADRs as important decisions are made*
-'''
-
-    
-    def _policies_template_en(self) -> str:
-        """Template policies.md - English"""
-        return '''# POLICIES - {{ display_name }}
-
-**Generated at:** {{ timestamp }}
-
----
-
-## 🔧 Development Policies
-
-### Commits and Versioning
-
-- **Convention:** Conventional Commits (feat:, fix:, docs:, etc)
-- **Branches:**
-  - `main` → Production
-  - `develop` → Development
-  - `feature/*` → Features
-  - `hotfix/*` → Urgent fixes
-- **Pull Requests:** Required for merge into `main`
-
-### Code Review
-
-- **Minimum approvals:** 1 reviewer
-- **Review Checklist:**
-  - [ ] Code follows project standards
-  - [ ] Adequate tests included
-  - [ ] Documentation updated
-  - [ ] No hardcoded credentials or secrets
-
-### Tests
-
-{% if qualidade %}
-- **Minimum coverage:** {{ qualidade.cobertura_testes }}
-- **Tools:** {{ qualidade.ferramentas | join(", ") }}
-{% else %}
-- **Minimum coverage:** 70%
-- **Types:** Unit (required), Integration (when applicable)
-{% endif %}
-- **CI/CD:** Tests must pass before merge
-
----
-
-## 📦 Deployment Policies
-
-### Environments
-
-- **Development:** Automatic deploy from `develop`
-- **Staging:** Manual deploy for validation
-- **Production:** Deploy after approval and staging tests
-
-### Rollback
-
-- Keep last functional version always deployable
-- Documented rollback procedure
-- Feature flags for critical features
-
----
-
-## 🔒 Security Policies
-
-### Credentials
-
-- ❌ NEVER commit API keys, tokens, passwords
-- ✅ Use environment variables or secret managers
-- ✅ Rotate secrets regularly
-- ✅ Use `.env.example` without real values
-
-### Dependencies
-
-- Review dependencies before adding
-- Keep dependencies updated (security patches)
-- Use vulnerability scanning tools (Dependabot, Snyk)
-
-### Code
-
-- Validate inputs in all APIs
-- Use prepared statements for SQL
-- Escape outputs in templates
-- Implement rate limiting
-
----
-
-*Policies can be adjusted as the project evolves*
-'''
-    
-    def _emergency_template_en(self) -> str:
-        """Template emergency.md - English"""
-        return '''# EMERGENCY - {{ display_name }}
-
-**Last updated:** {{ timestamp }}
-
----
-
-## 🚨 Active Blockers
-
-*No blockers registered at the moment*
-
----
-
-## 📋 Block Registration Template
-
-### BLOCK-XXX: [Block Title]
-
-**Date:** YYYY-MM-DD HH:MM  
-**Severity:** 🔴 Critical | 🟡 Important | 🟢 Low  
-**Impact:** Which task/feature is blocked?
-
-**Description:**
-Detail the problem found.
-
-**Resolution Attempts:**
-1. What was already tried?
-2. Why didn't it work?
-
-**Additional Context:**
-- Relevant logs
-- Error messages
-- Involved configurations
-
-**Resolution:**
-*To be filled when resolved*
-
----
-
-## 📚 Resolved Blockers
-
-### BLOCK-000: Example of resolved blocker
-
-**Date:** {{ timestamp }}  
-**Severity:** 🟢 Low  
-**Resolution:** This is just an example to illustrate the format
-
----
-
-*Use this file only for blockers that prevent progress — not for common bugs*
-'''
-    
-    def _diary_index_template_en(self) -> str:
-        """Template diary-index.md - English"""
-        return '''# DIARY INDEX - {{ display_name }}
-
----
-
-## 📅 Diary Files
-
-### {{ now.strftime("%Y") }}
-
-- [{{ month }}.md](../diary/{{ month }}.md) - Active
-
----
-
-## 🔍 Quick Search
-
-### By Entry Type
-
-- **Important decisions:** Search for "DECISION:" in diary
-- **Resolved problems:** Search for "RESOLVED:"
-- **Blockers:** See `emergency.md`
-- **Refactorings:** Search for "REFACTOR:"
-
-### By Task
-
-- **TASK-XXX:** Use task ID as keyword
-- **EPIC-XXX:** Search by epic ID
-
----
-
-## 📝 How to Register in the Diary
-
-### Standard Format
-
-```markdown
-### [HH:MM] TASK-XXX - Short title
-
-**Context:** [What you were doing]
-
-**Action:** [What was done]
-
-**Result:** [What happened]
-
-**Next steps:** [What remains to be done]
-
-**Notes:** [Additional information]
-```
-
-### Examples
-
-```markdown
-### [14:30] TASK-001 - Setup JWT
-
-**Context:** Starting authentication implementation
-
-**Action:** Installed jsonwebtoken library and configured middleware
-
-**Result:** Middleware created and tested locally
-
-**Next steps:** Create /login endpoint
-
-**Notes:** Use RS256 algorithm in production
-```
-
----
-
-*This index is automatically updated as new files are created*
-'''
-
-    
-    def _session_context_template_en(self) -> str:
-        """Template session-context.md - English"""
-        return '''# SESSION CONTEXT - {{ display_name }}
-
-**Generated at:** {{ timestamp }}  
-**Agent:** setup-squidy-ai  
-**Current Task:** TASK-001  
-**Phase:** Planning/Initial Setup
-
----
-
-## 📊 Current State (Executive Summary)
-
-Project "{{ display_name }}" was successfully configured using Squidy Setup AI.
-
-**Technology Stack:**
-- Frontend: {{ stack.frontend }}
-- Backend: {{ stack.backend }}
-- Database: {{ stack.banco }}
-
-**Blockers:** None  
-**Dependencies:** According to chosen stack
-
----
-
-## 📚 Quick References
-
-- **Constitution:** Review purpose and principles before starting
-- **Oracle:** ADR-001 defines technology stack
-- **Policies:** Follow commit and code review conventions
-- **Kanban:** TASK-001 available to start
-
----
-
-## 🧠 Short-term Memory
-
-1. Project automatically configured via AI interview
-2. Complete Squidy structure generated
-3. Ready for development to begin
-
----
-
-## ⚠️ Active Alerts
-
-🔔 **REMINDER:** Review and adjust settings as needed  
-🔔 **ATTENTION:** Add first real task to kanban (replace TASK-001)
-
----
-
-## 🎯 Next Expected Action
-
-Review structure and start development of TASK-001
-
----
-
-*Update this file at the end of each work session*
-'''
-    
-    def _agent_template_en(self) -> str:
-        """Template AGENT.md (quick reference) - English"""
-        return '''# AGENT - Quick Reference
-
-**Project:** {{ display_name }}  
-**Type:** {{ agent_type }}  
-**Generated:** {{ timestamp }}
-
----
-
-## 🎯 Who You Are
-
-{{ agent_type.replace("-", " ").title() }} responsible for {{ display_name }}
-
-## 🎯 Mission
-
-{{ proposito }}
-
----
-
-## 📜 Rules (ALWAYS follow)
-
-{% for principio in principios %}
-- {{ principio }}
-{% endfor %}
-
----
-
-## 🚫 Prohibitions (NEVER do)
-
-{% for proibicao in proibicoes %}
-- {{ proibicao }}
-{% endfor %}
-
----
-
-## ✅ Definition of Done
-
-{% for criterio in dod %}
-- [ ] {{ criterio }}
-{% endfor %}
-
----
-
-## 🛠️ Stack
-
-- **Frontend:** {{ stack.frontend }}
-- **Backend:** {{ stack.backend }}
-- **Database:** {{ stack.banco }}
-
----
-
-## 🧭 Quick Navigation
-
-| File | Content |
-|------|---------|
-| `constitution.md` | Complete principles and prohibitions |
-| `oracle.md` | Architecture decisions (ADRs) |
-| `policies.md` | Code and deployment conventions |
-| `kanban.md` | Open tasks |
-| `emergency.md` | Critical blockers |
-| `session-context.md` | Current project state |
-
----
-
-*For complete initialization, read `../readme-agent.md` in root*
-'''
-    
-    def _diary_template_en(self) -> str:
-        """Template diary.md (monthly) - English"""
-        return '''# DIARY - {{ display_name }} - {{ month }}
-
----
-
-## {{ date }}
-
-### Project Initial Setup
-
-**Timestamp:** {{ timestamp }}  
-**Agent:** squidy-setup-ai  
-**Action:** Automatic generation of Squidy v2.0 structure  
-**Context:** Project configured via interactive AI interview
-
-**Decisions made:**
-- Technology stack defined: {{ stack.frontend }} + {{ stack.backend }} + {{ stack.banco }}
-- Agent type: {{ agent_type }}
-- Purpose documented in Constitution
-- {{ principios | length }} principles defined
-- {{ proibicoes | length }} prohibitions established
-
-**Next steps:**
-1. Review generated files (especially `constitution.md`)
-2. Adjust `kanban.md` with real project tasks
-3. Configure development environment
-4. Start TASK-001
-
----
-
-*Format: ### [HH:MM] TASK-XXX - Description*
-'''
+        names = self._template_names.get(language)
+        if names is None:
+            names = self._template_names[self.DEFAULT_LANGUAGE]
+        return names
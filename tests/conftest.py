@@ -0,0 +1,70 @@
+"""
+Fixtures compartilhadas dos testes
+"""
+
+from pathlib import PurePosixPath
+
+import pytest
+
+from squidy.adapters.filesystem.mock_fs import MockFileSystem
+from squidy.core.domain.config import ProjectConfig
+from squidy.core.i18n import I18nManager, i18n
+from squidy.generation.file_generator import FileGenerator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _jinja_cache(tmp_path_factory: pytest.TempPathFactory):
+    """Cache de bytecode do Jinja em diretório temporário (não toca o ~/.cache real)"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SQUIDY_JINJA_CACHE", str(tmp_path_factory.mktemp("jinja")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def i18n_mgr() -> I18nManager:
+    """Singleton de i18n com todos os idiomas pré-carregados (uma vez por sessão)"""
+    i18n.reset()
+    for lang_code in I18nManager.SUPPORTED_LANGUAGES:
+        i18n._load_translations(lang_code)
+    return i18n
+
+
+@pytest.fixture(autouse=True)
+def _reset_language(i18n_mgr: I18nManager):
+    """Volta ao idioma padrão antes de cada teste (mantém o cache de traduções)"""
+    i18n_mgr.current_lang = i18n_mgr.default_lang = I18nManager.DEFAULT_LANGUAGE
+    yield
+
+
+@pytest.fixture(scope="session")
+def _generated_project(i18n_mgr: I18nManager) -> tuple[MockFileSystem, PurePosixPath, list[str]]:
+    """Projeto completo em pt-BR, gerado uma única vez por sessão"""
+    i18n_mgr.set_language("pt-BR")
+    fs = MockFileSystem()
+    config = ProjectConfig(
+        project_name="test-project",
+        display_name="Test Project",
+        proposito="Projeto de teste",
+        stack={
+            "frontend": "React",
+            "backend": "Node.js",
+            "banco": "PostgreSQL",
+        },
+    )
+    output_dir = PurePosixPath("/test-output")
+    generated = FileGenerator(fs).generate_all(config, output_dir, progress=False)
+    return fs, output_dir, generated
+
+
+@pytest.fixture
+def generated_project(_generated_project):
+    """
+    Projeto gerado: (fs, diretório de saída, arquivos gerados)
+    
+    O filesystem é restaurado ao fim de cada teste, então testes
+    podem modificá-lo sem afetar os demais.
+    """
+    fs = _generated_project[0]
+    state = fs.snapshot()
+    yield _generated_project
+    fs.restore(state)
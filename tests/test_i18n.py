@@ -13,17 +13,27 @@ from squidy.core.i18n import I18nManager, i18n, t
 class TestI18nManager:
     """Testes do I18nManager"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, i18n_mgr):
         """Setup para cada teste"""
-        # Limpa a instância singleton
-        I18nManager._instance = None
-        self.i18n = I18nManager()
+        self.i18n = i18n_mgr
     
     def test_singleton_pattern(self):
         """Testa que I18nManager é singleton"""
         i1 = I18nManager()
         i2 = I18nManager()
         assert i1 is i2
+        assert i1 is i18n
+    
+    def test_reset(self):
+        """Testa que reset restaura idioma padrão e limpa caches"""
+        self.i18n.set_language("en-US")
+        self.i18n.t("banner.title")
+        
+        self.i18n.reset()
+        assert self.i18n.get_language() == "pt-BR"
+        assert self.i18n.translations == {}
+        assert I18nManager() is self.i18n
     
     def test_default_language(self):
         """Testa idioma padrão"""
@@ -94,6 +104,21 @@ class TestI18nManager:
         result = self.i18n.t("banner.title")
         assert result == "Squidy"  # Existe em ambos
     
+    def test_override_language(self):
+        """Testa troca temporária de idioma"""
+        self.i18n.set_language("pt-BR")
+        
+        with self.i18n.override_language("en-US") as applied:
+            assert applied is True
+            assert self.i18n.t("init.success") == "✅ Setup completed!"
+        
+        assert self.i18n.get_language() == "pt-BR"
+        assert "en-US" in self.i18n.translations  # Cache mantido
+        
+        with self.i18n.override_language("fr-FR") as applied:
+            assert applied is False
+            assert self.i18n.get_language() == "pt-BR"
+    
     def test_clear_cache(self):
         """Testa limpeza de cache"""
         self.i18n.set_language("pt-BR")
@@ -108,10 +133,6 @@ class TestI18nManager:
 class TestGlobalI18nFunctions:
     """Testes das funções globais de i18n"""
     
-    def setup_method(self):
-        """Setup para cada teste"""
-        I18nManager._instance = None
-    
     def test_global_t_function(self):
         """Testa função global t()"""
         i18n.set_language("pt-BR")
@@ -127,10 +148,10 @@ class TestGlobalI18nFunctions:
 class TestI18nIntegration:
     """Testes de integração do i18n com outros componentes"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, i18n_mgr):
         """Setup para cada teste"""
-        I18nManager._instance = None
-        self.i18n = I18nManager()
+        self.i18n = i18n_mgr
     
     def test_language_persistence(self):
         """Testa que idioma persiste entre chamadas"""
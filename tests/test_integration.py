@@ -3,28 +3,38 @@ Testes de integração do Squidy
 """
 
 import pytest
-from pathlib import Path
+from pathlib import PurePosixPath
 from datetime import datetime
 
+from squidy.adapters.filesystem.local_fs import LocalFileSystem
 from squidy.adapters.filesystem.mock_fs import MockFileSystem
 from squidy.core.domain.config import ProjectConfig
-from squidy.core.i18n import I18nManager, i18n
+from squidy.core.i18n import i18n
+from squidy.core.jsonio import loads
 from squidy.generation.file_generator import FileGenerator
 from squidy.audit.engine import AuditEngine
 from squidy.audit.checkers.structure_checker import StructureChecker
 from squidy.audit.detectors.heuristic_detector import HeuristicDetector
 
 
+# Caminhos usados pelos testes (montados uma única vez)
+OUTPUT_DIR = PurePosixPath("/test-output")
+OUTPUT_DIR_PT = PurePosixPath("/test-output-pt")
+OUTPUT_DIR_EN = PurePosixPath("/test-output-en")
+README = OUTPUT_DIR / "readme-agent.md"
+CONSTITUICAO = OUTPUT_DIR / "doc" / "constituicao.md"
+KANBAN = OUTPUT_DIR / "doc" / "kanban.md"
+DIARIO_DIR = OUTPUT_DIR / "diario"
+MANIFEST = OUTPUT_DIR / ".squidy" / "manifest.json"
+PROJECT_DIR = PurePosixPath("/test-project")
+EMPTY_PROJECT_DIR = PurePosixPath("/empty-project")
+
+
 class TestI18nIntegration:
     """Testes de integração de internacionalização"""
     
-    def setup_method(self):
-        """Setup para cada teste"""
-        I18nManager._instance = None
-    
     def test_file_generation_with_language_pt(self):
         """Testa geração de arquivos em português"""
-        i18n.set_language("pt-BR")
         fs = MockFileSystem()
         generator = FileGenerator(fs)
         
@@ -34,17 +44,16 @@ class TestI18nIntegration:
             proposito="Projeto de teste",
         )
         
-        output_dir = Path("/test-output")
-        generator.generate_all(config, output_dir, progress=False)
+        with i18n.override_language("pt-BR"):
+            generator.generate_all(config, OUTPUT_DIR, progress=False)
         
         # Verifica conteúdo em português
-        readme_content = fs.read_text(output_dir / "readme-agent.md")
+        readme_content = fs.read_text(README)
         assert "Ritual de Inicialização" in readme_content
         assert "Contexto do Projeto" in readme_content
     
     def test_file_generation_with_language_en(self):
         """Testa geração de arquivos em inglês"""
-        i18n.set_language("en-US")
         fs = MockFileSystem()
         generator = FileGenerator(fs)
         
@@ -54,17 +63,16 @@ class TestI18nIntegration:
             proposito="Test purpose",
         )
         
-        output_dir = Path("/test-output")
-        generator.generate_all(config, output_dir, progress=False)
+        with i18n.override_language("en-US"):
+            generator.generate_all(config, OUTPUT_DIR, progress=False)
         
         # Verifica conteúdo em inglês
-        readme_content = fs.read_text(output_dir / "readme-agent.md")
+        readme_content = fs.read_text(README)
         assert "Initialization Ritual" in readme_content
         assert "Project Context" in readme_content
     
     def test_manifest_contains_language(self):
         """Testa que manifest.json contém o idioma"""
-        i18n.set_language("en-US")
         fs = MockFileSystem()
         generator = FileGenerator(fs)
         
@@ -74,13 +82,11 @@ class TestI18nIntegration:
             proposito="Test purpose",
         )
         
-        output_dir = Path("/test-output")
-        generator.generate_all(config, output_dir, progress=False)
+        with i18n.override_language("en-US"):
+            generator.generate_all(config, OUTPUT_DIR, progress=False)
         
-        # Verifica manifest
-        import json
-        manifest_content = fs.read_text(output_dir / ".squidy" / "manifest.json")
-        manifest = json.loads(manifest_content)
+        # Verifica manifest (bytes direto para o parser, sem decodificar)
+        manifest = loads(fs.read_bytes(MANIFEST))
         
         assert manifest["language"] == "en-US"
     
@@ -96,18 +102,16 @@ class TestI18nIntegration:
         )
         
         # Gera em português
-        i18n.set_language("pt-BR")
-        output_dir_pt = Path("/test-output-pt")
-        generator.generate_all(config, output_dir_pt, progress=False)
+        with i18n.override_language("pt-BR"):
+            generator.generate_all(config, OUTPUT_DIR_PT, progress=False)
         
         # Gera em inglês
-        i18n.set_language("en-US")
-        output_dir_en = Path("/test-output-en")
-        generator.generate_all(config, output_dir_en, progress=False)
+        with i18n.override_language("en-US"):
+            generator.generate_all(config, OUTPUT_DIR_EN, progress=False)
         
         # Verifica diferenças
-        readme_pt = fs.read_text(output_dir_pt / "readme-agent.md")
-        readme_en = fs.read_text(output_dir_en / "readme-agent.md")
+        readme_pt = fs.read_text(OUTPUT_DIR_PT / "readme-agent.md")
+        readme_en = fs.read_text(OUTPUT_DIR_EN / "readme-agent.md")
         
         assert "Ritual de Inicialização" in readme_pt
         assert "Initialization Ritual" in readme_en
@@ -117,33 +121,19 @@ class TestI18nIntegration:
 class TestFileGeneration:
     """Testes de geração de arquivos"""
     
-    def test_generate_all_files(self):
+    def test_generate_all_files(self, generated_project):
         """Testa geração completa de arquivos"""
-        fs = MockFileSystem()
-        generator = FileGenerator(fs)
+        fs, _, generated = generated_project
         
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Projeto de teste",
-            stack={
-                "frontend": "React",
-                "backend": "Node.js",
-                "banco": "PostgreSQL",
-            },
-        )
-        
-        output_dir = Path("/test-output")
-        generated = generator.generate_all(config, output_dir, progress=False)
-        
-        # Verifica se todos os arquivos foram gerados
-        assert len(generated) == 10  # 9 arquivos + diário
+        # Verifica se todos os arquivos foram gerados (10 templates + 1 diário + 1 manifest)
+        assert len(generated) == 12
         
         # Verifica se arquivos existem no filesystem mock
-        assert fs.exists(output_dir / "readme-agent.md")
-        assert fs.exists(output_dir / "doc" / "constituicao.md")
-        assert fs.exists(output_dir / "doc" / "kanban.md")
-        assert fs.exists(output_dir / "diario")
+        assert fs.exists(README)
+        assert fs.exists(CONSTITUICAO)
+        assert fs.exists(KANBAN)
+        assert fs.exists(DIARIO_DIR)
+        assert fs.exists(MANIFEST)
     
     def test_generate_single_file(self):
         """Testa geração de arquivo único"""
@@ -156,11 +146,10 @@ class TestFileGeneration:
             proposito="Projeto de teste",
         )
         
-        output_dir = Path("/test-output")
-        path = generator.generate_single(config, output_dir, "readme-agent.md")
+        path = generator.generate_single(config, OUTPUT_DIR, "readme-agent.md")
         
         assert path == "readme-agent.md"
-        assert fs.exists(output_dir / "readme-agent.md")
+        assert fs.exists(README)
 
 
 class TestAudit:
@@ -172,31 +161,20 @@ class TestAudit:
         checker = StructureChecker(fs)
         
         # Cria diretório vazio
-        project_path = Path("/test-project")
-        fs.mkdir(project_path / "doc", parents=True)
-        fs.mkdir(project_path / "diario", parents=True)
+        fs.mkdir(PROJECT_DIR / "doc", parents=True)
+        fs.mkdir(PROJECT_DIR / "diario", parents=True)
         
         # Executa checker
-        findings = checker.check(project_path)
+        findings = checker.check(PROJECT_DIR)
         
         # Deve encontrar arquivos faltantes
         assert len(findings) > 0
-        assert any("readme-agent.md" in f.message for f in findings)
+        assert "readme-agent.md" in {f.missing_path for f in findings}
     
-    def test_structure_checker_passes_complete_project(self):
+    def test_structure_checker_passes_complete_project(self, generated_project):
         """Testa que StructureChecker passa em projeto completo"""
-        fs = MockFileSystem()
-        generator = FileGenerator(fs)
-        
-        # Gera projeto completo
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Projeto de teste",
-        )
-        
-        project_path = Path("/test-project")
-        generator.generate_all(config, project_path, progress=False)
+        # Projeto completo gerado uma vez por sessão
+        fs, project_path, _ = generated_project
         
         # Executa checker
         checker = StructureChecker(fs)
@@ -212,19 +190,20 @@ class TestAudit:
         detector = HeuristicDetector(fs)
         
         # Sem arquivos - não deve detectar
-        project_path = Path("/empty-project")
-        fs.mkdir(project_path, parents=True)
+        fs.mkdir(EMPTY_PROJECT_DIR, parents=True)
         
-        assert not detector.detect(project_path)
-        assert detector.get_confidence(project_path) == 0.0
+        detected, confidence = detector.detect_and_score(EMPTY_PROJECT_DIR)
+        assert not detected
+        assert confidence == 0.0
         
         # Com arquivos característicos - deve detectar
-        fs.write_text(project_path / "readme-agent.md", "# Test")
-        fs.write_text(project_path / "doc" / "constituicao.md", "# Test")
-        fs.write_text(project_path / "doc" / "kanban.md", "# Test")
+        fs.write_text(EMPTY_PROJECT_DIR / "readme-agent.md", "# Test")
+        fs.write_text(EMPTY_PROJECT_DIR / "doc" / "constituicao.md", "# Test")
+        fs.write_text(EMPTY_PROJECT_DIR / "doc" / "kanban.md", "# Test")
         
-        assert detector.detect(project_path)
-        assert detector.get_confidence(project_path) > 0.5
+        detected, confidence = detector.detect_and_score(EMPTY_PROJECT_DIR)
+        assert detected
+        assert confidence > 0.5
 
 
 class TestProjectConfig:
@@ -259,151 +238,41 @@ class TestProjectConfig:
         assert "stack" in data
 
 
-class TestFileGeneration:
 
+class TestLocalFileSystem:
+    """Testes do adaptador de disco"""
     
-    def test_generate_all_files(self):
-        """Testa geração completa de arquivos"""
-        fs = MockFileSystem()
-        generator = FileGenerator(fs)
+    def test_write_chunks_keeps_file_on_error(self, tmp_path):
+        """Testa que erro no meio das partes preserva o arquivo existente"""
+        fs = LocalFileSystem()
+        path = tmp_path / "AGENT.md"
+        path.write_text("conteúdo original", encoding="utf-8")
         
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Projeto de teste",
-            stack={
-                "frontend": "React",
-                "backend": "Node.js",
-                "banco": "PostgreSQL",
-            },
-        )
+        def chunks():
+            yield "parcial"
+            raise RuntimeError("falha na renderização")
         
-        output_dir = Path("/test-output")
-        generated = generator.generate_all(config, output_dir, progress=False)
+        with pytest.raises(RuntimeError):
+            fs.write_chunks(path, chunks())
         
-        # Verifica se todos os arquivos foram gerados (10 templates + 1 diário + 1 manifest)
-        assert len(generated) == 12
-        
-        # Verifica se arquivos existem no filesystem mock
-        assert fs.exists(output_dir / "readme-agent.md")
-        assert fs.exists(output_dir / "doc" / "constituicao.md")
-        assert fs.exists(output_dir / "doc" / "kanban.md")
-        assert fs.exists(output_dir / "diario")
-        assert fs.exists(output_dir / ".squidy" / "manifest.json")
-    
-    def test_generate_single_file(self):
-        """Testa geração de arquivo único"""
-        fs = MockFileSystem()
-        generator = FileGenerator(fs)
-        
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Projeto de teste",
-        )
-        
-        output_dir = Path("/test-output")
-        path = generator.generate_single(config, output_dir, "readme-agent.md")
+        assert path.read_text(encoding="utf-8") == "conteúdo original"
+        assert [p.name for p in tmp_path.iterdir()] == ["AGENT.md"]
         
-        assert path == "readme-agent.md"
-        assert fs.exists(output_dir / "readme-agent.md")
-
-
-class TestAudit:
-    """Testes de auditoria"""
+        fs.write_chunks(path, iter(["novo ", "conteúdo"]))
+        assert path.read_text(encoding="utf-8") == "novo conteúdo"
     
-    def test_structure_checker_finds_missing_files(self):
-        """Testa que StructureChecker encontra arquivos faltantes"""
-        fs = MockFileSystem()
-        checker = StructureChecker(fs)
-        
-        # Cria diretório vazio
-        project_path = Path("/test-project")
-        fs.mkdir(project_path / "doc", parents=True)
-        fs.mkdir(project_path / "diario", parents=True)
-        
-        # Executa checker
-        findings = checker.check(project_path)
-        
-        # Deve encontrar arquivos faltantes
-        assert len(findings) > 0
-        assert any("readme-agent.md" in f.message for f in findings)
-    
-    def test_structure_checker_passes_complete_project(self):
-        """Testa que StructureChecker passa em projeto completo"""
-        fs = MockFileSystem()
-        generator = FileGenerator(fs)
-        
-        # Gera projeto completo
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Projeto de teste",
-        )
-        
-        project_path = Path("/test-project")
-        generator.generate_all(config, project_path, progress=False)
-        
-        # Executa checker
-        checker = StructureChecker(fs)
-        findings = checker.check(project_path)
-        
-        # Não deve haver findings críticos
-        critical = [f for f in findings if f.severity.value == "critical"]
-        assert len(critical) == 0
-    
-    def test_heuristic_detector(self):
-        """Testa detector heurístico"""
-        fs = MockFileSystem()
-        detector = HeuristicDetector(fs)
-        
-        # Sem arquivos - não deve detectar
-        project_path = Path("/empty-project")
-        fs.mkdir(project_path, parents=True)
-        
-        assert not detector.detect(project_path)
-        assert detector.get_confidence(project_path) == 0.0
-        
-        # Com arquivos característicos - deve detectar
-        fs.write_text(project_path / "readme-agent.md", "# Test")
-        fs.write_text(project_path / "doc" / "constituicao.md", "# Test")
-        fs.write_text(project_path / "doc" / "kanban.md", "# Test")
-        
-        assert detector.detect(project_path)
-        assert detector.get_confidence(project_path) > 0.5
-
-
-class TestProjectConfig:
-    """Testes de configuração"""
-    
-    def test_config_validation(self):
-        """Testa validação de configuração"""
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Teste",
-        )
-        
-        assert config.project_name == "test-project"
-        assert config.display_name == "Test Project"
-        assert len(config.principios) > 0  # Valores padrão
-        assert len(config.proibicoes) > 0
-        assert len(config.dod) > 0
-    
-    def test_config_to_dict(self):
-        """Testa conversão para dicionário"""
-        config = ProjectConfig(
-            project_name="test-project",
-            display_name="Test Project",
-            proposito="Teste",
-        )
-        
-        data = config.to_dict()
-        
-        assert data["project_name"] == "test-project"
-        assert data["display_name"] == "Test Project"
-        assert "stack" in data
-
+    def test_write_chunks_follows_symlink(self, tmp_path):
+        """Testa que a escrita passa pelo link simbólico (o link é mantido)"""
+        fs = LocalFileSystem()
+        target = tmp_path / "real.md"
+        target.write_text("antigo", encoding="utf-8")
+        link = tmp_path / "AGENT.md"
+        link.symlink_to(target.name)
+        
+        fs.write_chunks(link, iter(["novo"]))
+        
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "novo"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,11 +4,30 @@ Testes de Templates com Internacionalização
 Testes para verificar renderização de templates em múltiplos idiomas.
 """
 
+import re
+
 import pytest
 from pathlib import Path
 
-from squidy.generation.template_engine import TemplateEngine
-from squidy.core.i18n import I18nManager
+from jinja2 import Environment, FileSystemBytecodeCache
+
+from squidy.generation.template_engine import TemplateEngine, _template_metadata
+
+# Tags Jinja que não deveriam sobrar no conteúdo renderizado
+UNRENDERED_TAG = re.compile(r"\{\{|\}\}|\{%|%\}")
+
+# Marcadores de idioma do readme-agent (verificados em uma única busca)
+README_MARKERS_PT = ("Ritual de Inicialização", "Contexto do Projeto", "Regras de Ouro", "📜 Princípios")
+README_MARKERS_EN = ("Initialization Ritual", "Project Context", "Golden Rules", "📜 Principles")
+
+
+def _markers_pattern(markers: tuple[str, ...]) -> re.Pattern:
+    """Compila os marcadores em uma única alternação"""
+    return re.compile("|".join(map(re.escape, markers)))
+
+
+README_PT = _markers_pattern(README_MARKERS_PT)
+README_EN = _markers_pattern(README_MARKERS_EN)
 
 
 class TestTemplateEngineI18n:
@@ -16,7 +35,6 @@ class TestTemplateEngineI18n:
     
     def setup_method(self):
         """Setup para cada teste"""
-        I18nManager._instance = None
         self.engine = TemplateEngine()
         self.sample_config = {
             "display_name": "Test Project",
@@ -52,6 +70,10 @@ class TestTemplateEngineI18n:
         # Verifica que todos os templates existem em ambos
         for key in self.engine._templates_pt:
             assert key in self.engine._templates_en
+        
+        # Catálogos compartilhados são somente leitura
+        with pytest.raises(TypeError):
+            self.engine._templates_pt["novo.md"] = "pt-BR/novo.md"
     
     def test_render_readme_agent_pt_br(self):
         """Testa renderização do readme-agent em pt-BR"""
@@ -62,10 +84,7 @@ class TestTemplateEngineI18n:
         )
         
         # Verifica elementos em português
-        assert "Ritual de Inicialização" in content
-        assert "Contexto do Projeto" in content
-        assert "Regras de Ouro" in content
-        assert "📜 Princípios" in content
+        assert set(README_PT.findall(content)) == set(README_MARKERS_PT)
     
     def test_render_readme_agent_en_us(self):
         """Testa renderização do readme-agent em en-US"""
@@ -76,10 +95,7 @@ class TestTemplateEngineI18n:
         )
         
         # Verifica elementos em inglês
-        assert "Initialization Ritual" in content
-        assert "Project Context" in content
-        assert "Golden Rules" in content
-        assert "📜 Principles" in content
+        assert set(README_EN.findall(content)) == set(README_MARKERS_EN)
     
     def test_render_constitution_pt_br(self):
         """Testa renderização da constituição em pt-BR"""
@@ -107,6 +123,18 @@ class TestTemplateEngineI18n:
         assert "PROHIBITIONS" in content
         assert "DEFINITION OF DONE" in content
     
+    def test_constitution_convention_examples(self):
+        """Testa exemplos da tabela de convenções conforme o idioma"""
+        config = {**self.sample_config, "convencoes": {**self.sample_config["convencoes"], "variaveis": "snake_case"}}
+        
+        pt_content = self.engine.render("constituicao.md", language="pt-BR", **config)
+        en_content = self.engine.render("constituicao.md", language="en-US", **config)
+        
+        assert "`usuario_atual`" in pt_content
+        assert "`UsuarioService`" in pt_content
+        assert "`current_user`" in en_content
+        assert "`calculateTotal()`" in en_content
+    
     def test_render_kanban_pt_br(self):
         """Testa renderização do kanban em pt-BR"""
         content = self.engine.render(
@@ -179,10 +207,16 @@ class TestTemplateEngineI18n:
             "diario.md",
         ]
         
-        for template in templates:
-            content = self.engine.render(template, language="pt-BR", **self.sample_config)
+        rendered = [
+            self.engine.render(template, language="pt-BR", **self.sample_config)
+            for template in templates
+        ]
+        
+        for content in rendered:
             assert len(content) > 100  # Conteúdo não vazio
-            assert "{{" not in content  # Não deve haver tags não renderizadas
+        
+        # Uma única busca sobre todas as saídas: não deve haver tags não renderizadas
+        assert UNRENDERED_TAG.search("\x00".join(rendered)) is None
     
     def test_all_templates_render_successfully_en(self):
         """Testa que todos os templates renderizam em en-US"""
@@ -199,10 +233,41 @@ class TestTemplateEngineI18n:
             "diario.md",
         ]
         
-        for template in templates:
-            content = self.engine.render(template, language="en-US", **self.sample_config)
+        rendered = [
+            self.engine.render(template, language="en-US", **self.sample_config)
+            for template in templates
+        ]
+        
+        for content in rendered:
             assert len(content) > 100
-            assert "{{" not in content
+        
+        # Uma única busca sobre todas as saídas: não deve haver tags não renderizadas
+        assert UNRENDERED_TAG.search("\x00".join(rendered)) is None
+    
+    def test_render_cache_follows_context(self):
+        """Testa que saídas memoizadas acompanham mudanças na configuração"""
+        first = self.engine.render("AGENT.md", language="en-US", **self.sample_config)
+        self.sample_config["principios"].append("Small commits")
+        changed = self.engine.render("AGENT.md", language="en-US", **self.sample_config)
+        
+        assert "Small commits" not in first
+        assert "Small commits" in changed
+        self.sample_config["principios"].pop()
+        assert self.engine.render("AGENT.md", language="en-US", **self.sample_config) == first
+    
+    def test_template_metadata_cached_on_disk(self, tmp_path):
+        """Testa que metadados gravados no cache dispensam novo parse da mesma fonte"""
+        env = Environment(bytecode_cache=FileSystemBytecodeCache(str(tmp_path)))
+        source = "Projeto {{ display_name }}"
+        first = _template_metadata(env, source)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("fonte parseada novamente")
+        
+        env.parse = fail
+        assert _template_metadata(env, source) == first
+        assert first.variables == {"display_name"}
+        assert first.format_string == "Projeto {display_name}"
     
     def test_template_content_different_languages(self):
         """Testa que conteúdo é diferente entre idiomas"""